@@ -1,6 +1,6 @@
 # Generated by Django 5.1.2 on 2024-11-02 05:41
 
-import accounts.models
+import django.utils.timezone
 from django.db import migrations, models
 
 
@@ -47,7 +47,7 @@ class Migration(migrations.Migration):
                 ("is_staff", models.BooleanField(default=False)),
                 (
                     "date_joined",
-                    models.DateTimeField(default=accounts.models.get_utc_now),
+                    models.DateTimeField(default=django.utils.timezone.now),
                 ),
                 (
                     "groups",
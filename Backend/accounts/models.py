@@ -1,5 +1,3 @@
-from datetime import UTC
-from datetime import datetime as dt
 from typing import Any
 
 from django.contrib.auth.models import (
@@ -8,13 +6,21 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
-
-
-def get_utc_now():
-    return dt.now(UTC)
+from django.db.models.functions import Upper
+from django.utils import timezone
 
 
 class CustomUserManager(BaseUserManager["CustomUser"]):
+    @classmethod
+    def normalize_email(cls, email: str | None) -> str:
+        """Lowercase the domain part, without rsplit's intermediate list."""
+        email = email or ""
+        stripped = email.strip()
+        at = stripped.rfind("@")
+        if at < 0:
+            return email
+        return stripped[:at] + stripped[at:].lower()
+
     def create_user(
         self,
         email: str,
@@ -35,10 +41,11 @@ class CustomUserManager(BaseUserManager["CustomUser"]):
         password: str | None = None,
         **extra_fields: Any,
     ) -> "CustomUser":
-        extra_fields.setdefault("is_staff", True)
-        extra_fields.setdefault("is_superuser", True)
-
-        return self.create_user(email, password, **extra_fields)
+        return self.create_user(
+            email,
+            password,
+            **{"is_staff": True, "is_superuser": True, **extra_fields},
+        )
 
 
 class CustomUser(AbstractBaseUser, PermissionsMixin):
@@ -48,12 +55,18 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     last_name = models.CharField(max_length=50, blank=True, null=True)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
-    date_joined = models.DateTimeField(default=get_utc_now)
+    date_joined = models.DateTimeField(default=timezone.now)
 
     objects: CustomUserManager = CustomUserManager()  # type: ignore[assignment]
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["first_name", "last_name"]
 
+    class Meta:
+        indexes = [
+            # Matches the UPPER(email) that case-insensitive lookups compile to
+            models.Index(Upper("email"), name="customuser_email_upper_idx"),
+        ]
+
     def __str__(self):
         return self.email
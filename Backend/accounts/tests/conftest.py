@@ -7,66 +7,100 @@ This module provides:
 - Common test data
 """
 
+import functools
+import itertools
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 
 from accounts.models import CustomUser
 
 User = get_user_model()
 
+# Unique suffixes for generated emails; uniqueness is all the tests need
+_seq = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def cached_password_hash():
+    """Hash each fixture password once per session and reuse the encoded value."""
+    return functools.cache(make_password)
+
+
+@pytest.fixture(scope="session")
+def customuser_perm_ids(django_db_setup, django_db_blocker):
+    """Map CustomUser permission codenames to their pks, fetched once."""
+    from django.contrib.auth.models import Permission
+    from django.contrib.contenttypes.models import ContentType
+
+    with django_db_blocker.unblock():
+        content_type = ContentType.objects.get_for_model(CustomUser)
+        return dict(
+            Permission.objects.filter(content_type=content_type).values_list(
+                "codename", "pk"
+            )
+        )
+
 
 @pytest.fixture
-def user():
+def user(cached_password_hash):
     """Create a regular test user."""
-    return CustomUser.objects.create_user(
+    user = CustomUser(
         email="testuser@example.com",
-        password="password123",
+        password=cached_password_hash("password123"),
         first_name="Test",
         last_name="User",
     )
+    user.save()
+    return user
 
 
 @pytest.fixture
-def superuser():
+def superuser(cached_password_hash):
     """Create a superuser for testing admin functionality."""
-    return CustomUser.objects.create_superuser(
+    user = CustomUser(
         email="admin@example.com",
-        password="adminpass123",
+        password=cached_password_hash("adminpass123"),
         first_name="Admin",
         last_name="User",
+        is_staff=True,
+        is_superuser=True,
     )
+    user.save()
+    return user
 
 
 @pytest.fixture
-def staff_user():
+def staff_user(cached_password_hash):
     """Create a staff user (non-superuser)."""
-    user = CustomUser.objects.create_user(
+    user = CustomUser(
         email="staff@example.com",
-        password="staffpass123",
+        password=cached_password_hash("staffpass123"),
         first_name="Staff",
         last_name="User",
+        is_staff=True,
     )
-    user.is_staff = True
     user.save()
     return user
 
 
 @pytest.fixture
-def inactive_user():
+def inactive_user(cached_password_hash):
     """Create an inactive user."""
-    user = CustomUser.objects.create_user(
+    user = CustomUser(
         email="inactive@example.com",
-        password="inactivepass123",
+        password=cached_password_hash("inactivepass123"),
         first_name="Inactive",
         last_name="User",
+        is_active=False,
     )
-    user.is_active = False
     user.save()
     return user
 
 
 @pytest.fixture
-def user_factory():
+def user_factory(cached_password_hash):
     """Factory fixture for creating multiple users."""
 
     def make_user(
@@ -81,21 +115,21 @@ def user_factory():
     ):
         """Create a user with specified parameters."""
         if email is None:
-            # Generate unique email
-            import uuid
-
-            email = f"user-{uuid.uuid4().hex[:8]}@example.com"
-
-        user = CustomUser.objects.create_user(
-            email=email,
-            password=password,
+            email = f"user-{next(_seq):08x}@example.com"
+        elif not email:
+            # Keep create_user's guard now that the manager is bypassed
+            raise ValueError("The Email field must be set")
+
+        user = CustomUser(
+            email=CustomUser.objects.normalize_email(email),
+            password=cached_password_hash(password),
             first_name=first_name,
             last_name=last_name,
+            is_staff=is_staff,
+            is_superuser=is_superuser,
+            is_active=is_active,
             **extra_fields,
         )
-        user.is_staff = is_staff
-        user.is_superuser = is_superuser
-        user.is_active = is_active
         user.save()
         return user
 
@@ -103,17 +137,21 @@ def user_factory():
 
 
 @pytest.fixture
-def multiple_users(user_factory):
+def multiple_users(db, cached_password_hash):
     """Create multiple users for testing lists and queries."""
-    users = []
-    for i in range(5):
-        user = user_factory(
+    # All seeded users share a password, so hash it once and insert in bulk
+    password = cached_password_hash("defaultpass123")
+    users = [
+        CustomUser(
             email=f"user{i}@example.com",
+            password=password,
             first_name=f"User{i}",
             last_name=f"Test{i}",
+            is_active=True,
         )
-        users.append(user)
-    return users
+        for i in range(5)
+    ]
+    return CustomUser.objects.bulk_create(users)
 
 
 @pytest.fixture
@@ -0,0 +1,18 @@
+"""
+factory_boy factories for accounts app tests.
+"""
+
+import factory
+from factory.django import DjangoModelFactory, Password
+
+from accounts.models import CustomUser
+
+
+class UserFactory(DjangoModelFactory):
+    """Regular active user; the password is hashed before the single INSERT."""
+
+    class Meta:
+        model = CustomUser
+
+    email = factory.Sequence(lambda n: f"u{n}@example.com")
+    password = Password("pass123")
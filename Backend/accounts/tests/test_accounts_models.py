@@ -13,9 +13,12 @@ from datetime import UTC, datetime
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import BaseUserManager
 from django.db import IntegrityError
+from django.db.models.functions import Upper
+from django.utils import timezone
 
-from accounts.models import CustomUser, CustomUserManager, get_utc_now
+from accounts.models import CustomUser, CustomUserManager
 
 User = get_user_model()
 
@@ -93,48 +96,23 @@ class TestCustomUserModel:
         assert "first_name" in CustomUser.REQUIRED_FIELDS
         assert "last_name" in CustomUser.REQUIRED_FIELDS
 
-    def test_str_representation(self):
-        """String representation should be the email address."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
-        assert str(user) == "test@example.com"
+    def test_email_has_case_insensitive_index(self):
+        """Email should have an UPPER() index for case-insensitive lookups."""
+        indexes = {index.name: index for index in CustomUser._meta.indexes}
+        index = indexes["customuser_email_upper_idx"]
+        assert index.expressions == (Upper("email"),)
 
-    def test_date_joined_auto_set(self):
-        """date_joined should be automatically set on creation."""
+    def test_defaults(self):
+        """A user created with only email and password gets the model defaults."""
         user = CustomUser.objects.create_user(
             email="test@example.com", password="pass123"
         )
-        assert user.date_joined is not None
+        assert str(user) == "test@example.com"
         assert isinstance(user.date_joined, datetime)
-
-    def test_is_active_default_true(self):
-        """is_active should default to True."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
         assert user.is_active is True
-
-    def test_is_staff_default_false(self):
-        """is_staff should default to False for regular users."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
         assert user.is_staff is False
-
-    def test_first_name_optional(self):
-        """first_name should be optional."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
-        assert user.first_name is None or user.first_name == ""
-
-    def test_last_name_optional(self):
-        """last_name should be optional."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
-        assert user.last_name is None or user.last_name == ""
+        assert not user.first_name
+        assert not user.last_name
 
     def test_password_is_hashed(self):
         """Password should be hashed, not stored in plain text."""
@@ -150,19 +128,15 @@ class TestCustomUserModel:
             email="test@example.com", password="pass123"
         )
         user.is_active = False
-        user.save()
-        user.refresh_from_db()
-        assert user.is_active is False
+        user.save(update_fields=["is_active"])
+        stored = CustomUser.objects.values_list("is_active", flat=True).get(pk=user.pk)
+        assert stored is False
 
     def test_user_permissions_mixin(self):
         """User should have PermissionsMixin functionality."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
-        # Test that PermissionsMixin fields exist
-        assert hasattr(user, "is_superuser")
-        assert hasattr(user, "groups")
-        assert hasattr(user, "user_permissions")
+        # Look the fields up on _meta so no related manager is built on an instance
+        for field_name in ("is_superuser", "groups", "user_permissions"):
+            CustomUser._meta.get_field(field_name)
 
 
 @pytest.mark.django_db
@@ -197,6 +171,23 @@ class TestCustomUserManager:
         # Domain should be lowercase
         assert "@example.com" in user.email
 
+    @pytest.mark.parametrize(
+        "email",
+        [
+            "Test@EXAMPLE.com",
+            "  padded@Example.COM  ",
+            "multi@at@Example.Com",
+            "no-at-sign",
+            "",
+            None,
+        ],
+    )
+    def test_normalize_email_matches_django(self, email):
+        """normalize_email should match BaseUserManager.normalize_email."""
+        assert CustomUserManager.normalize_email(
+            email
+        ) == BaseUserManager.normalize_email(email)
+
     def test_superuser_defaults_set_correctly(self):
         """create_superuser should set is_staff and is_superuser to True."""
         user = CustomUser.objects.create_superuser(
@@ -207,60 +198,62 @@ class TestCustomUserManager:
 
 
 @pytest.mark.django_db
-class TestGetUtcNow:
-    """Test the get_utc_now utility function."""
-
-    def test_get_utc_now_returns_datetime(self):
-        """get_utc_now should return a datetime object."""
-        now = get_utc_now()
-        assert isinstance(now, datetime)
-
-    def test_get_utc_now_is_utc(self):
-        """get_utc_now should return UTC time."""
-        now = get_utc_now()
-        assert now.tzinfo == UTC
-
-    def test_get_utc_now_is_current(self):
-        """get_utc_now should return current time (within 1 second)."""
-        now = get_utc_now()
-        current = datetime.now(UTC)
-        diff = abs((current - now).total_seconds())
-        assert diff < 1  # Should be within 1 second
+class TestDateJoined:
+    """Test the date_joined default."""
 
+    def test_date_joined_defaults_to_timezone_now(self):
+        """date_joined should default to django.utils.timezone.now."""
+        field = CustomUser._meta.get_field("date_joined")
+        assert field.default is timezone.now
 
-@pytest.mark.django_db
-class TestUserModelIntegration:
-    """Integration tests for user model with Django auth system."""
+    def test_explicit_date_joined_is_kept(self):
+        """An explicit date_joined (e.g. an imported user) should not be overwritten."""
+        joined = datetime(2024, 1, 1, tzinfo=UTC)
+        user = CustomUser.objects.create_user(
+            email="test@example.com", password="pass123", date_joined=joined
+        )
+        user.refresh_from_db()
+        assert user.date_joined == joined
 
-    def test_user_can_authenticate(self):
-        """User can be authenticated with email and password."""
-        from django.contrib.auth import authenticate
+    def test_date_joined_is_utc(self):
+        """date_joined should be stored as an aware UTC datetime."""
+        user = CustomUser.objects.create_user(
+            email="test@example.com", password="pass123"
+        )
+        assert user.date_joined.tzinfo == UTC
 
+    def test_date_joined_is_current(self):
+        """date_joined should be the current time (within 1 second)."""
         user = CustomUser.objects.create_user(
-            email="auth@example.com", password="testpass123"
+            email="test@example.com", password="pass123"
         )
-        authenticated = authenticate(email="auth@example.com", password="testpass123")
-        assert authenticated == user
+        current = datetime.now(UTC)
+        diff = abs((current - user.date_joined).total_seconds())
+        assert diff < 1  # Should be within 1 second
 
-    def test_wrong_password_returns_none(self):
-        """Authentication with wrong password returns None."""
-        from django.contrib.auth import authenticate
 
-        CustomUser.objects.create_user(email="auth@example.com", password="correctpass")
-        authenticated = authenticate(email="auth@example.com", password="wrongpass")
-        assert authenticated is None
+@pytest.mark.django_db
+class TestUserModelIntegration:
+    """Integration tests for user model with Django auth system."""
 
-    def test_inactive_user_cannot_authenticate(self):
-        """Inactive users cannot authenticate."""
+    @pytest.mark.parametrize(
+        ("password", "is_active", "expected"),
+        [
+            ("testpass123", True, "user"),
+            ("wrongpass", True, None),
+            ("testpass123", False, None),
+        ],
+        ids=["valid", "wrong-password", "inactive"],
+    )
+    def test_authenticate(self, user_factory, password, is_active, expected):
+        """Only an active user with the right password authenticates."""
         from django.contrib.auth import authenticate
 
-        user = CustomUser.objects.create_user(
-            email="inactive@example.com", password="testpass"
+        user = user_factory(
+            email="auth@example.com", password="testpass123", is_active=is_active
         )
-        user.is_active = False
-        user.save()
-        authenticated = authenticate(email="inactive@example.com", password="testpass")
-        assert authenticated is None
+        authenticated = authenticate(email="auth@example.com", password=password)
+        assert authenticated == (user if expected == "user" else None)
 
     def test_get_user_model_returns_custom_user(self):
         """get_user_model() should return CustomUser."""
@@ -12,25 +12,28 @@ This module tests:
 
 import pytest
 from django.contrib import admin
-from django.contrib.admin.sites import AdminSite
 from django.test import RequestFactory
 
 from accounts.admin import CustomUserAdmin
 from accounts.models import CustomUser
 
 
+@pytest.fixture(scope="module")
+def registered_admin():
+    """The CustomUserAdmin instance the admin site actually serves."""
+    return admin.site._registry[CustomUser]
+
+
 @pytest.mark.django_db
 class TestCustomUserAdmin:
     """Test CustomUserAdmin configuration."""
 
-    def test_custom_user_registered_in_admin(self):
+    def test_custom_user_registered_in_admin(self, registered_admin):
         """CustomUser should be registered in admin site."""
-        assert CustomUser in admin.site._registry
-        assert isinstance(admin.site._registry[CustomUser], CustomUserAdmin)
+        assert isinstance(registered_admin, CustomUserAdmin)
 
-    def test_list_display_fields(self):
+    def test_list_display_fields(self, registered_admin):
         """Admin list should display correct fields."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
         expected_fields = (
             "email",
             "first_name",
@@ -38,35 +41,30 @@ class TestCustomUserAdmin:
             "is_staff",
             "is_active",
         )
-        assert admin_instance.list_display == expected_fields
+        assert registered_admin.list_display == expected_fields
 
-    def test_list_filter_fields(self):
+    def test_list_filter_fields(self, registered_admin):
         """Admin should have correct filter options."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
         expected_filters = ("is_staff", "is_active")
-        assert admin_instance.list_filter == expected_filters
+        assert registered_admin.list_filter == expected_filters
 
-    def test_search_fields(self):
+    def test_search_fields(self, registered_admin):
         """Admin should be able to search by email and names."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
         expected_search = ("email", "first_name", "last_name")
-        assert admin_instance.search_fields == expected_search
+        assert registered_admin.search_fields == expected_search
 
-    def test_ordering(self):
+    def test_ordering(self, registered_admin):
         """Admin should order by email."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        assert admin_instance.ordering == ("email",)
+        assert registered_admin.ordering == ("email",)
 
-    def test_readonly_fields(self):
+    def test_readonly_fields(self, registered_admin):
         """Admin should have correct readonly fields."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
         expected_readonly = ("last_login", "date_joined", "groups")
-        assert admin_instance.readonly_fields == expected_readonly
+        assert registered_admin.readonly_fields == expected_readonly
 
-    def test_fieldsets_structure(self):
+    def test_fieldsets_structure(self, registered_admin):
         """Admin should have properly structured fieldsets."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        fieldsets = admin_instance.fieldsets
+        fieldsets = registered_admin.fieldsets
         assert fieldsets is not None
         assert len(fieldsets) == 4  # None, Personal Info, Permissions, Important dates
 
@@ -91,10 +89,9 @@ class TestCustomUserAdmin:
         assert "last_login" in fieldsets[3][1]["fields"]
         assert "date_joined" in fieldsets[3][1]["fields"]
 
-    def test_add_fieldsets_structure(self):
+    def test_add_fieldsets_structure(self, registered_admin):
         """Admin should have properly structured add_fieldsets."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        add_fieldsets = admin_instance.add_fieldsets
+        add_fieldsets = registered_admin.add_fieldsets
         assert len(add_fieldsets) > 0
 
         # Check that add form includes necessary fields
@@ -105,13 +102,12 @@ class TestCustomUserAdmin:
         assert "password1" in fields
         assert "password2" in fields
 
-    def test_uses_custom_forms(self):
+    def test_uses_custom_forms(self, registered_admin):
         """Admin should use custom user forms."""
         from accounts.forms import CustomUserChangeForm, CustomUserCreationForm
 
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        assert admin_instance.form == CustomUserChangeForm
-        assert admin_instance.add_form == CustomUserCreationForm
+        assert registered_admin.form == CustomUserChangeForm
+        assert registered_admin.add_form == CustomUserCreationForm
 
 
 @pytest.mark.django_db
@@ -143,64 +139,65 @@ class TestCustomUserAdminActions:
         """Provide a request factory."""
         return RequestFactory()
 
-    def test_admin_can_view_user_list(self, admin_user, regular_user, request_factory):
+    def test_admin_can_view_user_list(
+        self, admin_user, regular_user, request_factory, registered_admin
+    ):
         """Admin should be able to view user list."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
         request = request_factory.get("/admin/accounts/customuser/")
         request.user = admin_user
 
         # Get queryset
-        queryset = admin_instance.get_queryset(request)
+        queryset = registered_admin.get_queryset(request)
         assert admin_user in queryset
         assert regular_user in queryset
 
-    def test_admin_can_search_by_email(self, admin_user, regular_user):
+    def test_admin_can_search_by_email(
+        self, admin_user, regular_user, registered_admin
+    ):
         """Admin should be able to search users by email."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        assert "email" in admin_instance.search_fields
+        assert "email" in registered_admin.search_fields
         # Search functionality is tested through Django's admin interface
 
-    def test_admin_can_search_by_name(self, admin_user, regular_user):
+    def test_admin_can_search_by_name(self, admin_user, regular_user, registered_admin):
         """Admin should be able to search users by first and last name."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        assert "first_name" in admin_instance.search_fields
-        assert "last_name" in admin_instance.search_fields
+        assert "first_name" in registered_admin.search_fields
+        assert "last_name" in registered_admin.search_fields
 
-    def test_admin_can_filter_by_staff_status(self, admin_user, regular_user):
+    def test_admin_can_filter_by_staff_status(
+        self, admin_user, regular_user, registered_admin
+    ):
         """Admin should be able to filter by is_staff."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        assert "is_staff" in admin_instance.list_filter
+        assert "is_staff" in registered_admin.list_filter
 
-    def test_admin_can_filter_by_active_status(self, admin_user, regular_user):
+    def test_admin_can_filter_by_active_status(
+        self, admin_user, regular_user, registered_admin
+    ):
         """Admin should be able to filter by is_active."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        assert "is_active" in admin_instance.list_filter
+        assert "is_active" in registered_admin.list_filter
 
 
 @pytest.mark.django_db
 class TestAdminPermissions:
     """Test admin permissions and access control."""
 
+    # Each test creates only the user it checks, inside its own transaction
     @pytest.fixture
     def superuser(self):
-        """Create a superuser."""
+        """Superuser."""
         return CustomUser.objects.create_superuser(
             email="super@example.com", password="superpass"
         )
 
     @pytest.fixture
     def staff_user(self):
-        """Create a staff user (non-superuser)."""
-        user = CustomUser.objects.create_user(
-            email="staff@example.com", password="staffpass"
+        """Staff user (non-superuser)."""
+        return CustomUser.objects.create_user(
+            email="staff@example.com", password="staffpass", is_staff=True
         )
-        user.is_staff = True
-        user.save()
-        return user
 
     @pytest.fixture
     def regular_user(self):
-        """Create a regular user."""
+        """Regular user."""
         return CustomUser.objects.create_user(
             email="regular@example.com", password="regularpass"
         )
@@ -236,21 +233,28 @@ class TestAdminDisplay:
         )
         assert str(user) == "display@example.com"
 
-    def test_admin_shows_user_status(self):
+    def test_admin_shows_user_status(self, registered_admin):
         """Admin list should show user active and staff status."""
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        assert "is_active" in admin_instance.list_display
-        assert "is_staff" in admin_instance.list_display
+        assert "is_active" in registered_admin.list_display
+        assert "is_staff" in registered_admin.list_display
 
-    def test_admin_list_ordered_by_email(self):
+    def test_admin_list_ordered_by_email(self, cached_password_hash, registered_admin):
         """Admin list should be ordered by email."""
-        CustomUser.objects.create_user(email="zuser@example.com", password="pass")
-        CustomUser.objects.create_user(email="auser@example.com", password="pass")
-        CustomUser.objects.create_user(email="muser@example.com", password="pass")
+        password = cached_password_hash("pass")
+        CustomUser.objects.bulk_create(
+            [
+                CustomUser(email=email, password=password)
+                for email in (
+                    "zuser@example.com",
+                    "auser@example.com",
+                    "muser@example.com",
+                )
+            ],
+            batch_size=3,
+        )
 
-        admin_instance = CustomUserAdmin(CustomUser, AdminSite())
-        ordering = admin_instance.ordering or []
-        users = list(CustomUser.objects.all().order_by(*ordering))
+        ordering = registered_admin.ordering or []
+        users = list(CustomUser.objects.only("email").order_by(*ordering))
         assert users[0].email == "auser@example.com"
         assert users[1].email == "muser@example.com"
         assert users[2].email == "zuser@example.com"
@@ -15,16 +15,24 @@ from django.contrib.auth import get_user_model
 
 from accounts.forms import CustomUserChangeForm, CustomUserCreationForm
 from accounts.models import CustomUser
+from accounts.tests.factories import UserFactory
 
 User = get_user_model()
 
+VALID_CREATION_DATA = {
+    "email": "test@example.com",
+    "first_name": "John",
+    "last_name": "Doe",
+    "password1": "ComplexPass123!",
+    "password2": "ComplexPass123!",
+}
 
-@pytest.mark.django_db
-class TestCustomUserCreationForm:
-    """Test CustomUserCreationForm functionality."""
 
-    def test_form_has_correct_fields(self):
-        """Form should have email, first_name, last_name, and password fields."""
+class TestFormConfiguration:
+    """Test form field and model configuration; no database access needed."""
+
+    def test_creation_form_has_correct_fields(self):
+        """Creation form should have email, name and password fields."""
         form = CustomUserCreationForm()
         assert "email" in form.fields
         assert "first_name" in form.fields
@@ -32,6 +40,31 @@ class TestCustomUserCreationForm:
         assert "password1" in form.fields
         assert "password2" in form.fields
 
+    def test_creation_form_uses_correct_model(self):
+        """Creation form should use CustomUser model."""
+        form = CustomUserCreationForm()
+        assert form.Meta.model == CustomUser
+
+    def test_change_form_has_correct_fields(self):
+        """Change form should have all user edit fields."""
+        form = CustomUserChangeForm()
+        assert "email" in form.fields
+        assert "first_name" in form.fields
+        assert "last_name" in form.fields
+        assert "password" in form.fields
+        assert "is_active" in form.fields
+        assert "is_staff" in form.fields
+
+    def test_change_form_uses_correct_model(self):
+        """Change form should use CustomUser model."""
+        form = CustomUserChangeForm()
+        assert form.Meta.model == CustomUser
+
+
+@pytest.mark.django_db
+class TestCustomUserCreationForm:
+    """Test CustomUserCreationForm functionality."""
+
     def test_valid_form_creates_user(self):
         """Valid form data should create a user."""
         form_data = {
@@ -49,70 +82,46 @@ class TestCustomUserCreationForm:
         assert user.last_name == "Doe"
         assert user.check_password("ComplexPass123!")
 
-    def test_form_rejects_duplicate_email(self):
-        """Form should reject duplicate email addresses."""
-        CustomUser.objects.create_user(email="existing@example.com", password="pass123")
-        form_data = {
-            "email": "existing@example.com",
-            "first_name": "Jane",
-            "last_name": "Doe",
-            "password1": "ComplexPass123!",
-            "password2": "ComplexPass123!",
-        }
-        form = CustomUserCreationForm(data=form_data)
-        assert not form.is_valid()
-        assert "email" in form.errors
-
-    def test_form_rejects_mismatched_passwords(self):
-        """Form should reject when passwords don't match."""
-        form_data = {
-            "email": "test@example.com",
-            "first_name": "John",
-            "last_name": "Doe",
-            "password1": "Password123!",
-            "password2": "DifferentPass123!",
-        }
-        form = CustomUserCreationForm(data=form_data)
-        assert not form.is_valid()
-        assert "password2" in form.errors
-
-    def test_form_rejects_weak_password(self):
-        """Form should reject weak passwords."""
-        form_data = {
-            "email": "test@example.com",
-            "first_name": "John",
-            "last_name": "Doe",
-            "password1": "123",
-            "password2": "123",
-        }
-        form = CustomUserCreationForm(data=form_data)
-        assert not form.is_valid()
-        assert "password2" in form.errors
-
-    def test_form_requires_email(self):
-        """Form should require email field."""
+    @pytest.mark.parametrize(
+        ("overrides", "error_field", "needs_existing_user"),
+        [
+            pytest.param(
+                {"email": "existing@example.com"},
+                "email",
+                True,
+                id="duplicate-email",
+            ),
+            pytest.param(
+                {"password2": "DifferentPass123!"},
+                "password2",
+                False,
+                id="mismatched-passwords",
+            ),
+            pytest.param(
+                {"password1": "123", "password2": "123"},
+                "password2",
+                False,
+                id="weak-password",
+            ),
+            pytest.param({"email": None}, "email", False, id="missing-email"),
+            pytest.param({"email": "not-an-email"}, "email", False, id="invalid-email"),
+        ],
+    )
+    def test_form_rejects_invalid_data(
+        self, overrides, error_field, needs_existing_user
+    ):
+        """Form should reject invalid data and report it on the right field."""
+        # Only the duplicate-email case needs a row to collide with
+        if needs_existing_user:
+            UserFactory(email="existing@example.com")
+        # A None override drops the field from the submitted data
+        form_data = {**VALID_CREATION_DATA, **overrides}
         form_data = {
-            "first_name": "John",
-            "last_name": "Doe",
-            "password1": "ComplexPass123!",
-            "password2": "ComplexPass123!",
+            key: value for key, value in form_data.items() if value is not None
         }
         form = CustomUserCreationForm(data=form_data)
         assert not form.is_valid()
-        assert "email" in form.errors
-
-    def test_form_requires_valid_email(self):
-        """Form should require valid email format."""
-        form_data = {
-            "email": "not-an-email",
-            "first_name": "John",
-            "last_name": "Doe",
-            "password1": "ComplexPass123!",
-            "password2": "ComplexPass123!",
-        }
-        form = CustomUserCreationForm(data=form_data)
-        assert not form.is_valid()
-        assert "email" in form.errors
+        assert error_field in form.errors
 
     def test_form_allows_optional_first_name(self):
         """Form should allow empty first_name."""
@@ -124,10 +133,9 @@ class TestCustomUserCreationForm:
             "password2": "ComplexPass123!",
         }
         form = CustomUserCreationForm(data=form_data)
-        # Check if form is valid - depends on Meta configuration
-        if form.is_valid():
-            user = form.save()
-            assert user.first_name in ("", None)  # Nullable field can be None
+        assert form.is_valid(), form.errors
+        user = form.save()
+        assert user.first_name in ("", None)  # Nullable field can be None
 
     def test_form_allows_optional_last_name(self):
         """Form should allow empty last_name."""
@@ -139,38 +147,25 @@ class TestCustomUserCreationForm:
             "password2": "ComplexPass123!",
         }
         form = CustomUserCreationForm(data=form_data)
-        # Check if form is valid - depends on Meta configuration
-        if form.is_valid():
-            user = form.save()
-            assert user.last_name in ("", None)  # Nullable field can be None
+        assert form.is_valid(), form.errors
+        user = form.save()
+        assert user.last_name in ("", None)  # Nullable field can be None
 
-    def test_form_uses_correct_model(self):
-        """Form should use CustomUser model."""
-        form = CustomUserCreationForm()
-        assert form.Meta.model == CustomUser
+
+@pytest.fixture
+def change_user(db):
+    """User edited by the change form tests."""
+    return UserFactory(email="test@example.com")
 
 
 @pytest.mark.django_db
 class TestCustomUserChangeForm:
     """Test CustomUserChangeForm functionality."""
 
-    def test_form_has_correct_fields(self):
-        """Form should have all user edit fields."""
-        form = CustomUserChangeForm()
-        assert "email" in form.fields
-        assert "first_name" in form.fields
-        assert "last_name" in form.fields
-        assert "password" in form.fields
-        assert "is_active" in form.fields
-        assert "is_staff" in form.fields
-
     def test_form_can_update_user(self):
         """Form should be able to update existing user."""
-        user = CustomUser.objects.create_user(
-            email="original@example.com",
-            password="pass123",
-            first_name="Original",
-            last_name="Name",
+        user = UserFactory(
+            email="original@example.com", first_name="Original", last_name="Name"
         )
         form_data = {
             "email": "updated@example.com",
@@ -180,57 +175,43 @@ class TestCustomUserChangeForm:
             "is_staff": False,
         }
         form = CustomUserChangeForm(data=form_data, instance=user)
-        if form.is_valid():
-            updated_user = form.save()
-            assert updated_user.email == "updated@example.com"
-            assert updated_user.first_name == "Updated"
+        assert form.is_valid(), form.errors
+        updated_user = form.save()
+        assert updated_user.email == "updated@example.com"
+        assert updated_user.first_name == "Updated"
 
-    def test_form_can_change_is_active_status(self):
+    def test_form_can_change_is_active_status(self, change_user):
         """Form should be able to change is_active status."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
         form_data = {
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
+            "email": change_user.email,
+            "first_name": change_user.first_name,
+            "last_name": change_user.last_name,
             "is_active": False,
-            "is_staff": user.is_staff,
+            "is_staff": change_user.is_staff,
         }
-        form = CustomUserChangeForm(data=form_data, instance=user)
-        if form.is_valid():
-            updated_user = form.save()
-            assert updated_user.is_active is False
+        form = CustomUserChangeForm(data=form_data, instance=change_user)
+        assert form.is_valid(), form.errors
+        updated_user = form.save()
+        assert updated_user.is_active is False
 
-    def test_form_can_change_is_staff_status(self):
+    def test_form_can_change_is_staff_status(self, change_user):
         """Form should be able to change is_staff status."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
         form_data = {
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "is_active": user.is_active,
+            "email": change_user.email,
+            "first_name": change_user.first_name,
+            "last_name": change_user.last_name,
+            "is_active": change_user.is_active,
             "is_staff": True,
         }
-        form = CustomUserChangeForm(data=form_data, instance=user)
-        if form.is_valid():
-            updated_user = form.save()
-            assert updated_user.is_staff is True
+        form = CustomUserChangeForm(data=form_data, instance=change_user)
+        assert form.is_valid(), form.errors
+        updated_user = form.save()
+        assert updated_user.is_staff is True
 
-    def test_form_uses_correct_model(self):
-        """Form should use CustomUser model."""
-        form = CustomUserChangeForm()
-        assert form.Meta.model == CustomUser
-
-    def test_form_requires_instance_for_edit(self):
+    def test_form_requires_instance_for_edit(self, change_user):
         """Form should work with an instance for editing."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="pass123"
-        )
-        form = CustomUserChangeForm(instance=user)
-        assert form.instance == user
+        form = CustomUserChangeForm(instance=change_user)
+        assert form.instance == change_user
         assert form.initial["email"] == "test@example.com"
 
 
@@ -268,9 +249,7 @@ class TestFormIntegration:
 
     def test_change_form_preserves_password(self):
         """Change form should not require password change."""
-        user = CustomUser.objects.create_user(
-            email="test@example.com", password="originalpass"
-        )
+        user = UserFactory(email="test@example.com", password="originalpass")
         form_data = {
             "email": "test@example.com",
             "first_name": "Updated",
@@ -279,7 +258,7 @@ class TestFormIntegration:
             "is_staff": False,
         }
         form = CustomUserChangeForm(data=form_data, instance=user)
-        if form.is_valid():
-            updated_user = form.save()
-            # Password should still work
-            assert updated_user.check_password("originalpass")
+        assert form.is_valid(), form.errors
+        updated_user = form.save()
+        # Password should still work
+        assert updated_user.check_password("originalpass")
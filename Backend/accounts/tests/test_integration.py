@@ -11,11 +11,19 @@ This module tests:
 
 import pytest
 from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.models import Group
 
 from accounts.models import CustomUser
 
 User = get_user_model()
 
+SUPERUSER_PERMS = (
+    "any.permission",
+    "accounts.add_customuser",
+    "accounts.change_customuser",
+    "accounts.delete_customuser",
+)
+
 
 @pytest.mark.django_db
 class TestUserAuthentication:
@@ -44,11 +52,9 @@ class TestUserAuthentication:
 
     def test_inactive_user_cannot_authenticate(self):
         """Inactive users should not be able to authenticate."""
-        user = CustomUser.objects.create_user(
-            email="inactive@example.com", password="testpass"
+        CustomUser.objects.create_user(
+            email="inactive@example.com", password="testpass", is_active=False
         )
-        user.is_active = False
-        user.save()
         authenticated = authenticate(email="inactive@example.com", password="testpass")
         assert authenticated is None
 
@@ -82,11 +88,9 @@ class TestUserLogin:
 
     def test_inactive_user_cannot_login(self, client):
         """Inactive user should not be able to login."""
-        user = CustomUser.objects.create_user(
-            email="inactive@example.com", password="testpass"
+        CustomUser.objects.create_user(
+            email="inactive@example.com", password="testpass", is_active=False
         )
-        user.is_active = False
-        user.save()
         logged_in = client.login(email="inactive@example.com", password="testpass")
         assert logged_in is False
 
@@ -101,10 +105,7 @@ class TestUserPermissions:
             email="super@example.com", password="superpass"
         )
         # Superusers have all permissions
-        assert superuser.has_perm("any.permission")
-        assert superuser.has_perm("accounts.add_customuser")
-        assert superuser.has_perm("accounts.change_customuser")
-        assert superuser.has_perm("accounts.delete_customuser")
+        assert all(superuser.has_perm(perm) for perm in SUPERUSER_PERMS)
 
     def test_regular_user_has_no_permissions_by_default(self):
         """Regular user should have no permissions by default."""
@@ -121,31 +122,19 @@ class TestUserPermissions:
             email="staff@example.com", password="staffpass"
         )
         user.is_staff = True
-        user.save()
+        user.save(update_fields=["is_staff"])
         # Staff without superuser doesn't automatically have all perms
         assert not user.has_perm("any.permission")
 
-    def test_user_can_be_granted_specific_permissions(self):
+    def test_user_can_be_granted_specific_permissions(self, customuser_perm_ids):
         """User can be granted specific permissions."""
-        from django.contrib.auth.models import Permission
-        from django.contrib.contenttypes.models import ContentType
-
         user = CustomUser.objects.create_user(
             email="perms@example.com", password="permspass"
         )
 
-        # Get permission for CustomUser model
-        content_type = ContentType.objects.get_for_model(CustomUser)
-        permission = Permission.objects.get(
-            content_type=content_type, codename="add_customuser"
-        )
-
-        # Grant permission
-        user.user_permissions.add(permission)
-        user.save()
-
-        # Refresh from database
-        user = CustomUser.objects.get(pk=user.pk)
+        # Grant permission; add() writes the m2m row itself, and has_perm()
+        # has not run yet, so there is no cached permission set to refetch past
+        user.user_permissions.add(customuser_perm_ids["add_customuser"])
         assert user.has_perm("accounts.add_customuser")
 
 
@@ -155,8 +144,6 @@ class TestUserGroups:
 
     def test_user_can_be_added_to_group(self):
         """User can be added to a group."""
-        from django.contrib.auth.models import Group
-
         user = CustomUser.objects.create_user(
             email="group@example.com", password="grouppass"
         )
@@ -165,26 +152,18 @@ class TestUserGroups:
 
         assert group in user.groups.all()
 
-    def test_user_inherits_group_permissions(self):
+    def test_user_inherits_group_permissions(self, customuser_perm_ids):
         """User should inherit permissions from their groups."""
-        from django.contrib.auth.models import Group, Permission
-        from django.contrib.contenttypes.models import ContentType
-
         user = CustomUser.objects.create_user(
             email="inherit@example.com", password="inheritpass"
         )
         group = Group.objects.create(name="Editors")
 
-        # Add permission to group
-        content_type = ContentType.objects.get_for_model(CustomUser)
-        permission = Permission.objects.get(
-            content_type=content_type, codename="change_customuser"
-        )
-        group.permissions.add(permission)
+        # Add permission to group; m2m add() accepts pks, so no fetch is needed
+        group.permissions.add(customuser_perm_ids["change_customuser"])
 
         # Add user to group
-        user.groups.add(group)
-        user = CustomUser.objects.get(pk=user.pk)
+        user.groups.add(group.pk)
 
         # User should have the permission through the group
         assert user.has_perm("accounts.change_customuser")
@@ -199,22 +178,22 @@ class TestUserQuerySet:
         # Make one user inactive
         user = multiple_users[0]
         user.is_active = False
-        user.save()
+        user.save(update_fields=["is_active"])
 
         active_users = CustomUser.objects.filter(is_active=True)
-        assert user not in active_users
-        assert len(active_users) == len(multiple_users) - 1
+        assert not active_users.filter(pk=user.pk).exists()
+        assert active_users.count() == len(multiple_users) - 1
 
     def test_can_filter_staff_users(self, multiple_users):
         """Should be able to filter for staff users."""
         # Make one user staff
         user = multiple_users[0]
         user.is_staff = True
-        user.save()
+        user.save(update_fields=["is_staff"])
 
         staff_users = CustomUser.objects.filter(is_staff=True)
-        assert user in staff_users
-        assert len(staff_users) == 1
+        assert staff_users.filter(pk=user.pk).exists()
+        assert staff_users.count() == 1
 
     def test_can_search_by_email(self, multiple_users):
         """Should be able to search users by email."""
@@ -230,9 +209,14 @@ class TestUserQuerySet:
 
     def test_users_ordered_by_email(self):
         """Users can be ordered by email."""
-        CustomUser.objects.create_user(email="z@example.com", password="pass")
-        CustomUser.objects.create_user(email="a@example.com", password="pass")
-        CustomUser.objects.create_user(email="m@example.com", password="pass")
+        # Only ordering is under test, so skip hashing and insert in one query
+        users = [
+            CustomUser(email=email)
+            for email in ("z@example.com", "a@example.com", "m@example.com")
+        ]
+        for user in users:
+            user.set_unusable_password()
+        CustomUser.objects.bulk_create(users)
 
         users = CustomUser.objects.all().order_by("email")
         emails = [u.email for u in users]
@@ -254,14 +238,14 @@ class TestUserLifecycle:
 
         # Deactivate user
         user.is_active = False
-        user.save()
-        user.refresh_from_db()
+        user.save(update_fields=["is_active"])
+        user.refresh_from_db(fields=["is_active"])
         assert user.is_active is False
 
         # Reactivate user
         user.is_active = True
-        user.save()
-        user.refresh_from_db()
+        user.save(update_fields=["is_active"])
+        user.refresh_from_db(fields=["is_active"])
         assert user.is_active is True
 
         # Delete user
@@ -276,9 +260,9 @@ class TestUserLifecycle:
         assert user.check_password("oldpass")
 
         user.set_password("newpass")
-        user.save()
+        user.save(update_fields=["password"])
 
-        user.refresh_from_db()
+        # check_password reads the in-memory hash, so no reload is needed
         assert user.check_password("newpass")
         assert not user.check_password("oldpass")
 
@@ -293,16 +277,15 @@ class TestUserLifecycle:
 
         user.first_name = "New"
         user.last_name = "Name"
-        user.save()
+        user.save(update_fields=["first_name", "last_name"])
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["first_name", "last_name"])
         assert user.first_name == "New"
         assert user.last_name == "Name"
 
 
-@pytest.mark.django_db
-class TestUserModelIntegration:
-    """Test CustomUser integration with Django's auth system."""
+class TestAuthConfiguration:
+    """Test CustomUser's wiring into Django's auth system; no database needed."""
 
     def test_get_user_model_returns_custom_user(self):
         """get_user_model() should return CustomUser."""
@@ -316,15 +299,20 @@ class TestUserModelIntegration:
 
     def test_user_can_be_used_with_django_auth_forms(self):
         """CustomUser should work with Django's built-in auth forms."""
-        user = CustomUser.objects.create_user(
-            email="form@example.com", password="formpass"
-        )
-
-        # CustomUser should be compatible with Django's auth system
         # Forms like AuthenticationForm work with email as username
-        assert user.email == "form@example.com"
+        assert CustomUser.USERNAME_FIELD == "email"
+
+    def test_unsaved_user_checks_password(self):
+        """Password hashing and checking work on an unsaved instance."""
+        user = CustomUser(email="form@example.com")
+        user.set_password("formpass")
         assert user.check_password("formpass")
 
+
+@pytest.mark.django_db
+class TestUserModelIntegration:
+    """Test CustomUser integration with Django's auth system."""
+
     def test_last_login_updated_on_login(self, client):
         """User's last_login should be updated when they log in."""
         user = CustomUser.objects.create_user(
@@ -332,8 +320,8 @@ class TestUserModelIntegration:
         )
         assert user.last_login is None
 
-        # Login
-        client.login(email="lastlogin@example.com", password="loginpass")
+        # Password checks are covered by TestUserLogin; only the side effect matters
+        client.force_login(user)
 
-        user.refresh_from_db()
+        user.refresh_from_db(fields=["last_login"])
         assert user.last_login is not None
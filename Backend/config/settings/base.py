@@ -4,6 +4,13 @@ from pathlib import Path
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
+_TRUE = frozenset({"true", "1", "yes", "on"})
+
+
+def _env_bool(key, default):
+    # Case-insensitive, so "TRUE" and "1" don't silently read as False
+    return os.environ.get(key, default).lower() in _TRUE
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/dev/howto/deployment/checklist/
@@ -41,6 +48,12 @@ INSTALLED_APPS = [
     "accounts",
 ]
 
+# Processes that never serve /admin/ can set ADMIN_ENABLED=False; dropping the
+# app also skips admin autodiscovery in AdminConfig.ready()
+ADMIN_ENABLED = _env_bool("ADMIN_ENABLED", "True")
+if not ADMIN_ENABLED:
+    INSTALLED_APPS.remove("django.contrib.admin")
+
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
@@ -176,6 +189,9 @@ ACCOUNT_USER_MODEL_USERNAME_FIELD = None
 ACCOUNT_LOGIN_METHODS = {"email"}
 ACCOUNT_SIGNUP_FIELDS = ["email*", "password1*"]
 
+# Seconds a successful /health/ database probe is reused before re-checking
+HEALTHCHECK_TTL = float(os.environ.get("HEALTHCHECK_TTL", "2.0"))
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
@@ -6,14 +6,22 @@ from .base import *
 DEBUG = True
 ALLOWED_HOSTS = ["localhost", "127.0.0.1", "192.168.2.22"]
 
-# Add development apps
-INSTALLED_APPS += [
+# Add development apps. Build new lists rather than mutating base's in place:
+# config/settings/__init__.py imports this module even when another settings
+# module (e.g. config.settings.test) is selected, and in-place edits would leak
+# debug_toolbar into it.
+INSTALLED_APPS = [
+    *INSTALLED_APPS,
     "debug_toolbar",
     "django_extensions",
 ]
 
 # Add debug toolbar middleware
-MIDDLEWARE.insert(4, "debug_toolbar.middleware.DebugToolbarMiddleware")
+MIDDLEWARE = [
+    *MIDDLEWARE[:4],
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    *MIDDLEWARE[4:],
+]
 
 # Database (PostgreSQL for development)
 # https://docs.djangoproject.com/en/dev/ref/settings/#databases
@@ -0,0 +1,23 @@
+"""
+Password hashers for the test settings only.
+
+Never list these in base, development or production settings.
+"""
+
+from django.contrib.auth.hashers import MD5PasswordHasher
+from django.utils.crypto import constant_time_compare
+
+
+class PlainPasswordHasher(MD5PasswordHasher):
+    """Stores the password as "plain$$<password>"; tests never need real hashing."""
+
+    algorithm = "plain"
+
+    def encode(self, password, salt):
+        return f"{self.algorithm}$${password}"
+
+    def verify(self, password, encoded):
+        return constant_time_compare(encoded, self.encode(password, ""))
+
+    def must_update(self, encoded):
+        return False
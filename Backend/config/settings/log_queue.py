@@ -0,0 +1,20 @@
+"""
+Logging configuration callable for the production settings.
+
+Used via LOGGING_CONFIG so the "queue" handler's listener thread is
+started in every process that configures logging (each Gunicorn worker).
+"""
+
+import atexit
+import logging
+import logging.config
+
+
+def configure(logging_settings):
+    """Apply the dictConfig, then start the listener behind the "queue" handler."""
+    logging.config.dictConfig(logging_settings)
+    handler = logging.getHandlerByName("queue")
+    listener = getattr(handler, "listener", None)
+    if listener is not None:
+        listener.start()
+        atexit.register(listener.stop)
@@ -1,20 +1,35 @@
 from datetime import timedelta
 
 from .base import *
+from .base import _env_bool
+
+# Read the environment through one local name and shared parsers
+_env = os.environ
+
+
+def _env_int(key, default):
+    return int(_env.get(key, default))
+
+
+def _env_list(key, default):
+    # Drop blanks so an unset or trailing-comma value doesn't yield ""
+    return [item for item in _env.get(key, default).split(",") if item]
+
 
 # Production settings
 DEBUG = False
-ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "").split(",")
+ALLOWED_HOSTS = _env_list("ALLOWED_HOSTS", "")
 
 # Security settings
-SECRET_KEY = os.environ["SECRET_KEY"]  # Must be set in production
+SECRET_KEY = _env["SECRET_KEY"]  # Must be set in production
 
 # CORS Configuration for React frontend
-CORS_ALLOWED_ORIGINS = os.environ.get(
+CORS_ALLOWED_ORIGINS = _env_list(
     "CORS_ALLOWED_ORIGINS", "https://d1pjttps83iyey.cloudfront.net"
-).split(",")
+)
 CORS_ALLOW_CREDENTIALS = True
-CORS_ALLOW_HEADERS = [
+# A tuple like corsheaders.defaults.default_headers; its checks reject sets
+CORS_ALLOW_HEADERS = (
     "accept",
     "accept-encoding",
     "authorization",
@@ -24,21 +39,21 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
-]
+)
 
 # JWT Configuration
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(
-        minutes=int(os.environ.get("SIMPLE_JWT_ACCESS_TOKEN_LIFETIME_MINUTES", 60))
+        minutes=_env_int("SIMPLE_JWT_ACCESS_TOKEN_LIFETIME_MINUTES", 60)
     ),
     "REFRESH_TOKEN_LIFETIME": timedelta(
-        days=int(os.environ.get("SIMPLE_JWT_REFRESH_TOKEN_LIFETIME_DAYS", 7))
+        days=_env_int("SIMPLE_JWT_REFRESH_TOKEN_LIFETIME_DAYS", 7)
     ),
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": True,
     "ALGORITHM": "HS256",
-    "SIGNING_KEY": os.environ.get("SIMPLE_JWT_SIGNING_KEY", SECRET_KEY),
+    "SIGNING_KEY": _env.get("SIMPLE_JWT_SIGNING_KEY", SECRET_KEY),
     "VERIFYING_KEY": None,
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_HEADER_NAME": "HTTP_AUTHORIZATION",
@@ -63,26 +78,23 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    # JSON only; the browsable API's HTML templates are a development aid
     "DEFAULT_RENDERER_CLASSES": [
         "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",
     ],
 }
 
 # SSL/HTTPS Settings
-SECURE_SSL_REDIRECT = os.environ.get("SECURE_SSL_REDIRECT", "False") == "True"
+SECURE_SSL_REDIRECT = _env_bool("SECURE_SSL_REDIRECT", "False")
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 
 # HSTS Settings - Only enable if you're sure about full HTTPS
 # Read: https://docs.djangoproject.com/en/stable/ref/middleware/#http-strict-transport-security
-SECURE_HSTS_SECONDS = int(
-    os.environ.get("SECURE_HSTS_SECONDS", "0")
-)  # Set to 31536000 (1 year) when ready
-SECURE_HSTS_INCLUDE_SUBDOMAINS = (
-    os.environ.get("SECURE_HSTS_INCLUDE_SUBDOMAINS", "False") == "True"
-)
-SECURE_HSTS_PRELOAD = os.environ.get("SECURE_HSTS_PRELOAD", "False") == "True"
+# Set to 31536000 (1 year) when ready
+SECURE_HSTS_SECONDS = _env_int("SECURE_HSTS_SECONDS", "0")
+SECURE_HSTS_INCLUDE_SUBDOMAINS = _env_bool("SECURE_HSTS_INCLUDE_SUBDOMAINS", "False")
+SECURE_HSTS_PRELOAD = _env_bool("SECURE_HSTS_PRELOAD", "False")
 
 # Other security headers
 SECURE_BROWSER_XSS_FILTER = True
@@ -92,24 +104,43 @@ X_FRAME_OPTIONS = "DENY"
 # Database (PostgreSQL for production)
 DATABASES = {
     "default": {
-        "ENGINE": os.environ.get("DB_ENGINE", "django.db.backends.postgresql"),
-        "NAME": os.environ.get("DB_NAME", "postgres"),
-        "USER": os.environ.get("DB_USER", "postgres"),
-        "PASSWORD": os.environ.get("DB_PASSWORD"),
-        "HOST": os.environ.get("DB_HOST", "db"),
-        "PORT": os.environ.get("DB_PORT", "5432"),
+        "ENGINE": _env.get("DB_ENGINE", "django.db.backends.postgresql"),
+        "NAME": _env.get("DB_NAME", "postgres"),
+        "USER": _env.get("DB_USER", "postgres"),
+        "PASSWORD": _env.get("DB_PASSWORD"),
+        "HOST": _env.get("DB_HOST", "db"),
+        "PORT": _env.get("DB_PORT", "5432"),
+        # Reuse connections across requests instead of reconnecting each time.
+        # Behind PgBouncer in transaction mode, set CONN_MAX_AGE=0 and let the
+        # pooler hold the server connections.
+        "CONN_MAX_AGE": _env_int("CONN_MAX_AGE", "60"),
+        "CONN_HEALTH_CHECKS": True,
+        # Named cursors don't survive PgBouncer transaction pooling; set this
+        # only when deploying behind such a pooler
+        "DISABLE_SERVER_SIDE_CURSORS": _env_bool(
+            "DB_DISABLE_SERVER_SIDE_CURSORS", "False"
+        ),
+        "OPTIONS": {
+            # "require" for RDS; "prefer" keeps the compose "db" service working
+            "sslmode": _env.get("DB_SSLMODE", "prefer"),
+            "connect_timeout": 5,
+            "keepalives": 1,
+            "keepalives_idle": 30,
+        },
     }
 }
 
 # Email (SMTP for production)
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
-EMAIL_HOST = os.environ.get("EMAIL_HOST", "smtp.gmail.com")
-EMAIL_PORT = int(os.environ.get("EMAIL_PORT", "587"))
-EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "True") == "True"
-EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER")
-EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
+EMAIL_HOST = _env.get("EMAIL_HOST", "smtp.gmail.com")
+EMAIL_PORT = _env_int("EMAIL_PORT", "587")
+EMAIL_USE_TLS = _env_bool("EMAIL_USE_TLS", "True")
+EMAIL_HOST_USER = _env.get("EMAIL_HOST_USER")
+EMAIL_HOST_PASSWORD = _env.get("EMAIL_HOST_PASSWORD")
 
 # Logging
+# Request threads only enqueue records; a listener thread does the stream writes
+LOGGING_CONFIG = "config.settings.log_queue.configure"
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -124,15 +155,21 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": {"()": "queue.SimpleQueue"},
+            "handlers": ["console"],
+            "respect_handler_level": True,
+        },
     },
     "root": {
-        "handlers": ["console"],
+        "handlers": ["queue"],
         "level": "INFO",
     },
     "loggers": {
         "django": {
-            "handlers": ["console"],
-            "level": os.environ.get("DJANGO_LOG_LEVEL", "INFO"),
+            "handlers": ["queue"],
+            "level": _env.get("DJANGO_LOG_LEVEL", "INFO"),
             "propagate": False,
         },
     },
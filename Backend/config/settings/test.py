@@ -12,13 +12,22 @@ DATABASES = {
     }
 }
 
-# Simplified password hashing for faster tests
+# No-op password hashing for faster tests
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.MD5PasswordHasher",
+    "config.settings.hashers.PlainPasswordHasher",
 ]
 
 # Email (Memory backend for testing)
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
-# Note: To speed up tests, you can disable migrations by setting
-# MIGRATION_MODULES to a custom class that returns None for all apps
+
+# Build the test schema straight from the models instead of replaying migrations
+class DisableMigrations:
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
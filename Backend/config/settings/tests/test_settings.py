@@ -14,11 +14,83 @@ This module tests:
 """
 
 import os
+import runpy
 from pathlib import Path
 
 import pytest
 from django.conf import settings
 
+# Read once at import; the environment doesn't change during a test run
+DJANGO_ENV = os.environ.get("DJANGO_ENV")
+IS_TEST = DJANGO_ENV == "test"
+IS_PROD = DJANGO_ENV == "production"
+
+requires_test_env = pytest.mark.skipif(not IS_TEST, reason="test settings only")
+requires_production_env = pytest.mark.skipif(
+    not IS_PROD, reason="production settings only"
+)
+
+# Project paths the settings are expected to point at, built once
+TEMPLATES_DIR = settings.BASE_DIR / "templates"
+STATIC_DIR = settings.BASE_DIR / "static"
+STATICFILES_DIR = settings.BASE_DIR / "staticfiles"
+LOCALE_DIR = settings.BASE_DIR / "locale"
+
+# Settings don't change during a run; go through the lazy proxy once
+INSTALLED_APPS_SET = frozenset(settings.INSTALLED_APPS)
+MIDDLEWARE_SET = frozenset(settings.MIDDLEWARE)
+DEFAULT_DB = settings.DATABASES["default"]
+
+REQUIRED_CORE_APPS = frozenset(
+    {
+        "django.contrib.admin",
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "django.contrib.sessions",
+        "django.contrib.messages",
+        "django.contrib.staticfiles",
+        "django.contrib.sites",
+    }
+)
+REQUIRED_THIRD_PARTY_APPS = frozenset(
+    {
+        "allauth",
+        "allauth.account",
+        "crispy_forms",
+        "crispy_bootstrap5",
+        "rest_framework",
+        "whitenoise.runserver_nostatic",
+    }
+)
+REQUIRED_CUSTOM_APPS = frozenset({"accounts"})
+REQUIRED_MIDDLEWARE = frozenset(
+    {
+        "django.middleware.security.SecurityMiddleware",
+        "whitenoise.middleware.WhiteNoiseMiddleware",
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.common.CommonMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+        "django.middleware.clickjacking.XFrameOptionsMiddleware",
+        "allauth.account.middleware.AccountMiddleware",
+    }
+)
+REQUIRED_CONTEXT_PROCESSORS = frozenset(
+    {
+        "django.template.context_processors.debug",
+        "django.template.context_processors.request",
+        "django.contrib.auth.context_processors.auth",
+        "django.contrib.messages.context_processors.messages",
+    }
+)
+REQUIRED_AUTH_BACKENDS = frozenset(
+    {
+        "django.contrib.auth.backends.ModelBackend",
+        "allauth.account.auth_backends.AuthenticationBackend",
+    }
+)
+
 
 @pytest.fixture
 def development_settings():
@@ -58,6 +130,15 @@ def development_settings():
 class TestBaseSettings:
     """Test base settings that should be present in all environments."""
 
+    @pytest.mark.parametrize("value", ["false", "False", "0"])
+    def test_admin_disabled_drops_admin_app(self, monkeypatch, value):
+        """ADMIN_ENABLED=False should remove django.contrib.admin."""
+        monkeypatch.setenv("ADMIN_ENABLED", value)
+        # A fresh run of base.py; the loaded settings are untouched
+        base = runpy.run_module("config.settings.base")
+        assert base["ADMIN_ENABLED"] is False
+        assert "django.contrib.admin" not in base["INSTALLED_APPS"]
+
     def test_base_dir_exists(self):
         """Verify BASE_DIR is set correctly."""
         assert settings.BASE_DIR.exists()
@@ -66,59 +147,25 @@ class TestBaseSettings:
 
     def test_base_dir_structure(self):
         """Verify expected directories exist within BASE_DIR."""
-        expected_dirs = ["templates", "static", "config", "accounts"]
-        for dir_name in expected_dirs:
-            dir_path = settings.BASE_DIR / dir_name
-            assert dir_path.exists(), f"Expected directory {dir_name} not found"
-
-    def test_installed_apps_core(self):
-        """Verify core Django apps are installed."""
-        core_apps = [
-            "django.contrib.admin",
-            "django.contrib.auth",
-            "django.contrib.contenttypes",
-            "django.contrib.sessions",
-            "django.contrib.messages",
-            "django.contrib.staticfiles",
-            "django.contrib.sites",
-        ]
-        for app in core_apps:
-            assert app in settings.INSTALLED_APPS, f"{app} not in INSTALLED_APPS"
-
-    def test_third_party_apps_installed(self):
-        """Verify third-party apps are installed."""
-        third_party_apps = [
-            "allauth",
-            "allauth.account",
-            "crispy_forms",
-            "crispy_bootstrap5",
-            "rest_framework",
-            "whitenoise.runserver_nostatic",
-        ]
-        for app in third_party_apps:
-            assert app in settings.INSTALLED_APPS, f"{app} not in INSTALLED_APPS"
-
-    def test_custom_apps_installed(self):
-        """Verify custom apps are installed."""
-        custom_apps = ["accounts"]
-        for app in custom_apps:
-            assert app in settings.INSTALLED_APPS, f"{app} not in INSTALLED_APPS"
-
-    def test_middleware_configured(self):
-        """Verify essential middleware is present."""
-        required_middleware = [
-            "django.middleware.security.SecurityMiddleware",
-            "whitenoise.middleware.WhiteNoiseMiddleware",
-            "django.contrib.sessions.middleware.SessionMiddleware",
-            "django.middleware.common.CommonMiddleware",
-            "django.middleware.csrf.CsrfViewMiddleware",
-            "django.contrib.auth.middleware.AuthenticationMiddleware",
-            "django.contrib.messages.middleware.MessageMiddleware",
-            "django.middleware.clickjacking.XFrameOptionsMiddleware",
-            "allauth.account.middleware.AccountMiddleware",
-        ]
-        for middleware in required_middleware:
-            assert middleware in settings.MIDDLEWARE, f"{middleware} not in MIDDLEWARE"
+        expected_dirs = {"templates", "static", "config", "accounts"}
+        with os.scandir(settings.BASE_DIR) as entries:
+            found = {entry.name for entry in entries if entry.is_dir()}
+        missing = expected_dirs - found
+        assert not missing, f"Expected directories not found: {sorted(missing)}"
+
+    # Sorted so every xdist worker collects the same parameter order
+    @pytest.mark.parametrize(
+        "app",
+        sorted(REQUIRED_CORE_APPS | REQUIRED_THIRD_PARTY_APPS | REQUIRED_CUSTOM_APPS),
+    )
+    def test_installed_apps(self, app):
+        """Verify each required core, third-party and custom app is installed."""
+        assert app in INSTALLED_APPS_SET
+
+    @pytest.mark.parametrize("middleware", sorted(REQUIRED_MIDDLEWARE))
+    def test_middleware_configured(self, middleware):
+        """Verify each essential middleware is present."""
+        assert middleware in MIDDLEWARE_SET
 
     def test_middleware_order(self):
         """Verify critical middleware ordering."""
@@ -127,13 +174,11 @@ class TestBaseSettings:
         # WhiteNoise should be second (after security)
         assert settings.MIDDLEWARE[1] == "whitenoise.middleware.WhiteNoiseMiddleware"
         # Session middleware should come before auth middleware
-        session_idx = settings.MIDDLEWARE.index(
-            "django.contrib.sessions.middleware.SessionMiddleware"
-        )
-        auth_idx = settings.MIDDLEWARE.index(
-            "django.contrib.auth.middleware.AuthenticationMiddleware"
+        order = {name: i for i, name in enumerate(settings.MIDDLEWARE)}
+        assert (
+            order["django.contrib.sessions.middleware.SessionMiddleware"]
+            < order["django.contrib.auth.middleware.AuthenticationMiddleware"]
         )
-        assert session_idx < auth_idx
 
     def test_templates_configured(self):
         """Verify templates are configured."""
@@ -143,27 +188,21 @@ class TestBaseSettings:
             == "django.template.backends.django.DjangoTemplates"
         )
         # Verify template directories
-        assert settings.BASE_DIR / "templates" in settings.TEMPLATES[0]["DIRS"]
+        assert TEMPLATES_DIR in settings.TEMPLATES[0]["DIRS"]
         # Verify APP_DIRS is enabled
         assert settings.TEMPLATES[0]["APP_DIRS"] is True
 
     def test_template_context_processors(self):
         """Verify template context processors are configured."""
-        required_processors = [
-            "django.template.context_processors.debug",
-            "django.template.context_processors.request",
-            "django.contrib.auth.context_processors.auth",
-            "django.contrib.messages.context_processors.messages",
-        ]
         context_processors = settings.TEMPLATES[0]["OPTIONS"]["context_processors"]
-        for processor in required_processors:
-            assert processor in context_processors
+        missing = REQUIRED_CONTEXT_PROCESSORS - set(context_processors)
+        assert not missing, f"Missing context processors: {sorted(missing)}"
 
     def test_static_files_configured(self):
         """Verify static files settings."""
         assert settings.STATIC_URL == "/static/"
-        assert settings.STATIC_ROOT == settings.BASE_DIR / "staticfiles"
-        assert settings.BASE_DIR / "static" in settings.STATICFILES_DIRS
+        assert settings.STATIC_ROOT == STATICFILES_DIR
+        assert STATIC_DIR in settings.STATICFILES_DIRS
 
     def test_static_storage_configured(self):
         """Verify static file storage is configured for WhiteNoise."""
@@ -185,20 +224,25 @@ class TestBaseSettings:
         """Verify WSGI application is set."""
         assert settings.WSGI_APPLICATION == "config.wsgi.application"
 
-    def test_password_validators_configured(self):
-        """Verify password validators are configured."""
+    def test_password_validator_count(self):
+        """Verify exactly the four Django password validators are configured."""
         assert len(settings.AUTH_PASSWORD_VALIDATORS) == 4
-        validator_names = [
+
+    @pytest.mark.parametrize(
+        "validator",
+        [
             "UserAttributeSimilarityValidator",
             "MinimumLengthValidator",
             "CommonPasswordValidator",
             "NumericPasswordValidator",
-        ]
-        configured_validators = [
-            v["NAME"].split(".")[-1] for v in settings.AUTH_PASSWORD_VALIDATORS
-        ]
-        for validator in validator_names:
-            assert validator in configured_validators
+        ],
+    )
+    def test_password_validator_configured(self, validator):
+        """Verify each password validator is configured."""
+        configured = {
+            v["NAME"].rsplit(".", 1)[-1] for v in settings.AUTH_PASSWORD_VALIDATORS
+        }
+        assert validator in configured
 
     def test_internationalization_settings(self):
         """Verify internationalization settings."""
@@ -206,7 +250,7 @@ class TestBaseSettings:
         assert settings.TIME_ZONE == "UTC"
         assert settings.USE_I18N is True
         assert settings.USE_TZ is True
-        assert settings.BASE_DIR / "locale" in settings.LOCALE_PATHS
+        assert LOCALE_DIR in settings.LOCALE_PATHS
 
     def test_default_auto_field(self):
         """Verify default auto field is configured."""
@@ -231,12 +275,8 @@ class TestBaseSettings:
 
     def test_authentication_backends(self):
         """Verify authentication backends are configured."""
-        required_backends = [
-            "django.contrib.auth.backends.ModelBackend",
-            "allauth.account.auth_backends.AuthenticationBackend",
-        ]
-        for backend in required_backends:
-            assert backend in settings.AUTHENTICATION_BACKENDS
+        missing = REQUIRED_AUTH_BACKENDS - set(settings.AUTHENTICATION_BACKENDS)
+        assert not missing, f"Missing authentication backends: {sorted(missing)}"
 
     def test_rest_framework_configured(self):
         """Verify REST framework configuration."""
@@ -294,119 +334,109 @@ class TestDevelopmentSettings:
         assert "127.0.0.1" in development_settings["INTERNAL_IPS"]
 
 
+@requires_test_env
 class TestTestSettings:
     """Test test-environment-specific settings."""
 
     def test_debug_disabled(self):
         """Debug should be disabled in test environment."""
-        if os.environ.get("DJANGO_ENV") == "test":
-            assert settings.DEBUG is False
+        assert settings.DEBUG is False
 
     def test_testing_flag(self):
         """TESTING flag should be set in test environment."""
-        if os.environ.get("DJANGO_ENV") == "test":
-            assert hasattr(settings, "TESTING")
-            assert settings.TESTING is True
+        assert hasattr(settings, "TESTING")
+        assert settings.TESTING is True
 
     def test_database_in_memory(self):
         """Test environment should use in-memory database."""
-        if os.environ.get("DJANGO_ENV") == "test":
-            assert settings.DATABASES["default"]["NAME"] == ":memory:"
-            assert (
-                settings.DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3"
-            )
+        assert DEFAULT_DB["NAME"] == ":memory:"
+        assert DEFAULT_DB["ENGINE"] == "django.db.backends.sqlite3"
 
     def test_email_backend_memory(self):
         """Test environment should use memory email backend."""
-        if os.environ.get("DJANGO_ENV") == "test":
-            assert (
-                settings.EMAIL_BACKEND
-                == "django.core.mail.backends.locmem.EmailBackend"
-            )
+        assert settings.EMAIL_BACKEND == "django.core.mail.backends.locmem.EmailBackend"
 
     def test_password_hashers_simplified(self):
         """Test environment should use simplified password hashers."""
-        if os.environ.get("DJANGO_ENV") == "test":
-            md5_hasher = "django.contrib.auth.hashers.MD5PasswordHasher"
-            assert md5_hasher in settings.PASSWORD_HASHERS
+        plain_hasher = "config.settings.hashers.PlainPasswordHasher"
+        assert plain_hasher in settings.PASSWORD_HASHERS
 
 
+@requires_production_env
 class TestProductionSettings:
     """Test production-specific settings."""
 
     def test_debug_disabled(self):
         """Debug must be disabled in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert settings.DEBUG is False
+        assert settings.DEBUG is False
 
     def test_secret_key_from_env(self):
         """Secret key must come from environment in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            # Should raise error if SECRET_KEY not in environment
-            fallback_key = "django-insecure-fallback-key-for-development-only"
-            has_env_key = "SECRET_KEY" in os.environ
-            not_fallback = fallback_key != settings.SECRET_KEY
-            assert has_env_key or not_fallback
+        # Should raise error if SECRET_KEY not in environment
+        fallback_key = "django-insecure-fallback-key-for-development-only"
+        has_env_key = "SECRET_KEY" in os.environ
+        not_fallback = fallback_key != settings.SECRET_KEY
+        assert has_env_key or not_fallback
 
     def test_allowed_hosts_configured(self):
         """Allowed hosts must be configured in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert len(settings.ALLOWED_HOSTS) > 0
-            # Should not contain localhost only
-            assert settings.ALLOWED_HOSTS != ["localhost"]
+        assert len(settings.ALLOWED_HOSTS) > 0
+        # Should not contain localhost only
+        assert settings.ALLOWED_HOSTS != ["localhost"]
 
     def test_security_settings(self):
         """Verify security settings in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert settings.SESSION_COOKIE_SECURE is True
-            assert settings.CSRF_COOKIE_SECURE is True
-            assert settings.SECURE_BROWSER_XSS_FILTER is True
-            assert settings.SECURE_CONTENT_TYPE_NOSNIFF is True
-            assert settings.X_FRAME_OPTIONS == "DENY"
+        assert settings.SESSION_COOKIE_SECURE is True
+        assert settings.CSRF_COOKIE_SECURE is True
+        assert settings.SECURE_BROWSER_XSS_FILTER is True
+        assert settings.SECURE_CONTENT_TYPE_NOSNIFF is True
+        assert settings.X_FRAME_OPTIONS == "DENY"
 
     def test_hsts_settings(self):
         """Verify HSTS settings are available in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert hasattr(settings, "SECURE_HSTS_SECONDS")
-            assert hasattr(settings, "SECURE_HSTS_INCLUDE_SUBDOMAINS")
-            assert hasattr(settings, "SECURE_HSTS_PRELOAD")
+        assert hasattr(settings, "SECURE_HSTS_SECONDS")
+        assert hasattr(settings, "SECURE_HSTS_INCLUDE_SUBDOMAINS")
+        assert hasattr(settings, "SECURE_HSTS_PRELOAD")
 
     def test_database_postgresql(self):
         """Production should use PostgreSQL."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            db_engine = settings.DATABASES["default"]["ENGINE"]
-            assert "postgresql" in db_engine or "postgres" in db_engine
+        assert "postgres" in DEFAULT_DB["ENGINE"]
+        # Persistent connections, so requests don't pay for a new handshake
+        assert DEFAULT_DB["CONN_MAX_AGE"] >= 60
+        assert DEFAULT_DB["CONN_HEALTH_CHECKS"] is True
+
+    def test_rest_framework_renders_json_only(self):
+        """Production should not serve the browsable API."""
+        renderers = settings.REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"]
+        assert "rest_framework.renderers.JSONRenderer" in renderers
+        assert "rest_framework.renderers.BrowsableAPIRenderer" not in renderers
+
+    def test_brotli_installed(self):
+        """collectstatic should write .br files alongside .gz."""
+        from whitenoise.compress import brotli_installed
+
+        assert brotli_installed
 
     def test_database_credentials_from_env(self):
         """Database credentials should come from environment."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            db_config = settings.DATABASES["default"]
-            assert "NAME" in db_config
-            assert "USER" in db_config
-            assert "HOST" in db_config
-            assert "PORT" in db_config
+        assert {"NAME", "USER", "HOST", "PORT"} <= DEFAULT_DB.keys()
 
     def test_email_backend_smtp(self):
         """Production should use SMTP email backend."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert (
-                settings.EMAIL_BACKEND == "django.core.mail.backends.smtp.EmailBackend"
-            )
+        assert settings.EMAIL_BACKEND == "django.core.mail.backends.smtp.EmailBackend"
 
     def test_email_configuration(self):
         """Verify email configuration in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert hasattr(settings, "EMAIL_HOST")
-            assert hasattr(settings, "EMAIL_PORT")
-            assert hasattr(settings, "EMAIL_USE_TLS")
+        assert hasattr(settings, "EMAIL_HOST")
+        assert hasattr(settings, "EMAIL_PORT")
+        assert hasattr(settings, "EMAIL_USE_TLS")
 
     def test_logging_configured(self):
         """Verify logging is configured in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert hasattr(settings, "LOGGING")
-            assert "version" in settings.LOGGING
-            assert "handlers" in settings.LOGGING
-            assert "loggers" in settings.LOGGING
+        assert hasattr(settings, "LOGGING")
+        assert "version" in settings.LOGGING
+        assert "handlers" in settings.LOGGING
+        assert "loggers" in settings.LOGGING
 
 
 class TestEnvironmentVariables:
@@ -422,13 +452,15 @@ class TestEnvironmentVariables:
         assert isinstance(settings.ALLOWED_HOSTS, list)
         assert len(settings.ALLOWED_HOSTS) > 0
 
+    # Only meaningful when no environment-specific settings override DEBUG
+    @pytest.mark.skipif(
+        DJANGO_ENV in ("development", "test", "production"),
+        reason="DEBUG is set by the environment-specific settings",
+    )
     def test_debug_from_env(self):
         """DEBUG setting should respect environment variable."""
         debug_env = os.environ.get("DEBUG", "False")
-        expected_debug = debug_env == "True"
-        # Only test if not overridden by environment-specific settings
-        if os.environ.get("DJANGO_ENV") not in ["development", "test", "production"]:
-            assert expected_debug == settings.DEBUG
+        assert (debug_env == "True") == settings.DEBUG
 
     def test_default_from_email(self):
         """DEFAULT_FROM_EMAIL should be configured."""
@@ -442,11 +474,11 @@ class TestDatabaseConfiguration:
     def test_database_exists(self):
         """Verify default database is configured."""
         assert "default" in settings.DATABASES
-        assert "ENGINE" in settings.DATABASES["default"]
+        assert "ENGINE" in DEFAULT_DB
 
     def test_database_engine_valid(self):
         """Verify database engine is valid."""
-        engine = settings.DATABASES["default"]["ENGINE"]
+        engine = DEFAULT_DB["ENGINE"]
         valid_engines = [
             "django.db.backends.sqlite3",
             "django.db.backends.postgresql",
@@ -464,12 +496,12 @@ class TestStaticAndMediaFiles:
 
     def test_static_root_set(self):
         """Verify STATIC_ROOT is set."""
-        assert settings.STATIC_ROOT == settings.BASE_DIR / "staticfiles"
+        assert settings.STATIC_ROOT == STATICFILES_DIR
 
     def test_staticfiles_dirs_configured(self):
         """Verify STATICFILES_DIRS is configured."""
         assert len(settings.STATICFILES_DIRS) > 0
-        assert settings.BASE_DIR / "static" in settings.STATICFILES_DIRS
+        assert STATIC_DIR in settings.STATICFILES_DIRS
 
     def test_storages_configured(self):
         """Verify STORAGES setting is configured."""
@@ -489,13 +521,13 @@ class TestSecuritySettings:
         """Secret key should be sufficiently long."""
         # Django's default key length is 50, but fallback dev key is 49
         # In production, should be 50+, in dev/test 40+ is acceptable
-        min_length = 50 if os.environ.get("DJANGO_ENV") == "production" else 40
+        min_length = 50 if IS_PROD else 40
         assert len(settings.SECRET_KEY) >= min_length
 
+    @requires_production_env
     def test_secret_key_not_default_in_prod(self):
         """Secret key should not be default in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert "django-insecure" not in settings.SECRET_KEY
+        assert "django-insecure" not in settings.SECRET_KEY
 
     def test_allowed_hosts_not_empty(self):
         """ALLOWED_HOSTS should not be empty."""
@@ -503,38 +535,44 @@ class TestSecuritySettings:
 
     def test_csrf_protection_enabled(self):
         """CSRF middleware should be enabled."""
-        assert "django.middleware.csrf.CsrfViewMiddleware" in settings.MIDDLEWARE
+        assert "django.middleware.csrf.CsrfViewMiddleware" in MIDDLEWARE_SET
 
+    @requires_production_env
     def test_xframe_options(self):
         """X-Frame-Options should be set in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert hasattr(settings, "X_FRAME_OPTIONS")
-            assert settings.X_FRAME_OPTIONS in ["DENY", "SAMEORIGIN"]
+        assert hasattr(settings, "X_FRAME_OPTIONS")
+        assert settings.X_FRAME_OPTIONS in ["DENY", "SAMEORIGIN"]
 
 
+@requires_production_env
 class TestLoggingConfiguration:
     """Test logging configuration."""
 
     def test_logging_exists(self):
         """Verify logging configuration exists in production."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert hasattr(settings, "LOGGING")
+        assert hasattr(settings, "LOGGING")
 
     def test_logging_structure(self):
         """Verify logging configuration structure."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert "version" in settings.LOGGING
-            assert settings.LOGGING["version"] == 1
-            assert "handlers" in settings.LOGGING
-            assert "loggers" in settings.LOGGING
-            assert "formatters" in settings.LOGGING
+        assert "version" in settings.LOGGING
+        assert settings.LOGGING["version"] == 1
+        assert "handlers" in settings.LOGGING
+        assert "loggers" in settings.LOGGING
+        assert "formatters" in settings.LOGGING
 
     def test_console_handler(self):
         """Verify console handler is configured."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert "console" in settings.LOGGING["handlers"]
+        assert "console" in settings.LOGGING["handlers"]
 
     def test_django_logger(self):
         """Verify Django logger is configured."""
-        if os.environ.get("DJANGO_ENV") == "production":
-            assert "django" in settings.LOGGING["loggers"]
+        assert "django" in settings.LOGGING["loggers"]
+
+    def test_records_go_through_queue_handler(self):
+        """Loggers should enqueue records; only the listener writes to console."""
+        queue_handler = settings.LOGGING["handlers"]["queue"]
+        assert queue_handler["class"] == "logging.handlers.QueueHandler"
+        assert queue_handler["handlers"] == ["console"]
+        assert settings.LOGGING["root"]["handlers"] == ["queue"]
+        assert settings.LOGGING["loggers"]["django"]["handlers"] == ["queue"]
+        assert settings.LOGGING_CONFIG == "config.settings.log_queue.configure"
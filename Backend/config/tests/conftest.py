@@ -8,72 +8,154 @@ This module provides:
 """
 
 import os
+from dataclasses import dataclass
+from types import SimpleNamespace
 
 import pytest
 from django.conf import settings
+from django.db import connection
 
 
 @pytest.fixture
-def temp_env_var():
+def temp_env_var(monkeypatch):
     """Fixture to temporarily set environment variables."""
-    original_env = os.environ.copy()
+    # monkeypatch records and restores only the keys that get set
+    return monkeypatch.setenv
 
-    def _set_env(key, value):
-        os.environ[key] = value
 
-    yield _set_env
-
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
-
-
-@pytest.fixture
+# The environment and settings are fixed for a run, so these are computed once
+@pytest.fixture(scope="session")
 def django_env():
     """Get the current Django environment."""
     return os.environ.get("DJANGO_ENV", "test")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def is_development(django_env):
     """Check if running in development environment."""
     return django_env == "development"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def is_production(django_env):
     """Check if running in production environment."""
     return django_env == "production"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def is_test(django_env):
     """Check if running in test environment."""
     return django_env == "test"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def settings_module():
     """Get the current settings module path."""
     return os.environ.get("DJANGO_SETTINGS_MODULE")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_dir():
     """Get the BASE_DIR from settings."""
     return settings.BASE_DIR
 
 
-@pytest.fixture
+SNAPSHOT_SETTINGS = (
+    "DEBUG",
+    "TESTING",
+    "DATABASES",
+    "BASE_DIR",
+    "INSTALLED_APPS",
+    "MIDDLEWARE",
+    "TEMPLATES",
+    "SECRET_KEY",
+    "DEFAULT_FROM_EMAIL",
+    "ALLOWED_HOSTS",
+    "STATIC_URL",
+    "STATIC_ROOT",
+    "STATICFILES_DIRS",
+    "AUTHENTICATION_BACKENDS",
+    "AUTH_USER_MODEL",
+)
+
+
+@pytest.fixture(scope="session")
+def settings_snapshot():
+    """Plain namespace copy of the settings read by the environment tests.
+
+    Missing settings are left out, so hasattr() checks still work. Tests that
+    use override_settings must read django.conf.settings instead.
+    """
+    return SimpleNamespace(
+        **{
+            name: getattr(settings, name)
+            for name in SNAPSHOT_SETTINGS
+            if hasattr(settings, name)
+        }
+    )
+
+
+@pytest.fixture(scope="session")
 def installed_apps():
-    """Get list of installed apps."""
-    return settings.INSTALLED_APPS
+    """Get the installed apps as a set."""
+    return frozenset(settings.INSTALLED_APPS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def middleware():
-    """Get list of middleware."""
-    return settings.MIDDLEWARE
+    """Get the middleware as a set (use settings.MIDDLEWARE for order)."""
+    return frozenset(settings.MIDDLEWARE)
+
+
+@dataclass(frozen=True)
+class PgIntrospection:
+    """Server facts the PostgreSQL tests assert on."""
+
+    version: str
+    extensions: frozenset[str]
+    current_user: str
+    is_superuser: bool
+    has_migrations_table: bool
+    ssl_setting: str | None
+    ssl: bool | None
+    ssl_version: str | None
+    ssl_cipher: str | None
+
+
+# Every introspection probe in one round trip; pg_stat_ssl has no row for
+# non-SSL connections, hence the LEFT JOIN
+PG_INTROSPECTION_SQL = """
+SELECT
+    version(),
+    (SELECT array_agg(extname::text) FROM pg_extension),
+    current_user,
+    (SELECT usesuper FROM pg_user WHERE usename = current_user),
+    EXISTS (
+        SELECT FROM information_schema.tables
+        WHERE table_name = 'django_migrations'
+    ),
+    (SELECT setting FROM pg_settings WHERE name = 'ssl'),
+    s.ssl,
+    s.version,
+    s.cipher
+FROM (SELECT pg_backend_pid() AS pid) AS backend
+LEFT JOIN pg_stat_ssl AS s USING (pid);
+"""
+
+
+@pytest.fixture(scope="session")
+def pg_introspection(django_db_setup, django_db_blocker):
+    """PostgreSQL server facts, queried once per session.
+
+    Only the results are cached; database access is unblocked just for this
+    query, so tests without a django_db mark stay blocked.
+    """
+    if connection.vendor != "postgresql":
+        pytest.skip("PostgreSQL-specific test")
+    with django_db_blocker.unblock(), connection.cursor() as cursor:
+        cursor.execute(PG_INTROSPECTION_SQL)
+        version, extensions, *rest = cursor.fetchone()
+    return PgIntrospection(version, frozenset(extensions or ()), *rest)
 
 
 # Markers for environment-specific tests
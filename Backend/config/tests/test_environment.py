@@ -8,10 +8,46 @@ This module tests:
 - Environment-specific overrides
 """
 
+import importlib
 import os
+import re
 
+import pytest
 from django.conf import settings
 
+# Read once at import; pytest-django sets it before collection
+SETTINGS_MODULE = os.environ.get("DJANGO_SETTINGS_MODULE")
+SETTINGS_MODULE_IN_CONFIG = bool(
+    SETTINGS_MODULE and SETTINGS_MODULE.startswith("config.settings")
+)
+
+REQUIRED_APPS = frozenset(
+    {
+        "django.contrib.admin",
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+    }
+)
+CRITICAL_MIDDLEWARE = frozenset(
+    {
+        "django.middleware.security.SecurityMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+    }
+)
+REQUIRED_DIRS = frozenset({"config", "templates", "static"})
+
+# SQLite ":memory:" or file URI, or any name mentioning test/memorydb; covers
+# the test_ prefix and pytest-xdist's per-worker shared memory databases
+TEST_DB_NAME_RE = re.compile(r"^(?::memory:$|file:)|(?i:test|memorydb)")
+
+
+@pytest.fixture(scope="module")
+def base_dir_subdirs():
+    """Directory names directly under BASE_DIR, from a single listing."""
+    with os.scandir(settings.BASE_DIR) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_dir())
+
 
 class TestEnvironmentConfiguration:
     """Test environment-based configuration."""
@@ -23,19 +59,20 @@ class TestEnvironmentConfiguration:
 
     def test_pytest_uses_test_settings(self):
         """Pytest should use config.settings.test."""
-        settings_module = os.environ.get("DJANGO_SETTINGS_MODULE")
         assert (
-            settings_module == "config.settings.test"
-        ), f"Expected test settings, got: {settings_module}"
+            SETTINGS_MODULE == "config.settings.test"
+        ), f"Expected test settings, got: {SETTINGS_MODULE}"
 
-    def test_test_mode_enabled(self):
+    def test_test_mode_enabled(self, settings_snapshot):
         """TESTING flag should be True during tests."""
-        assert hasattr(settings, "TESTING")
-        assert settings.TESTING is True, "TESTING flag should be True in test settings"
+        assert hasattr(settings_snapshot, "TESTING")
+        assert (
+            settings_snapshot.TESTING is True
+        ), "TESTING flag should be True in test settings"
 
-    def test_test_database_configuration(self):
+    def test_test_database_configuration(self, settings_snapshot):
         """Test database should be properly configured for testing."""
-        db_config = settings.DATABASES["default"]
+        db_config = settings_snapshot.DATABASES["default"]
 
         # During pytest runs, the database is managed by pytest-django
         # It uses the test settings but may create a test database
@@ -44,144 +81,121 @@ class TestEnvironmentConfiguration:
         assert "NAME" in db_config
 
         # The database name should indicate it's for testing
-        # pytest-xdist creates different database names for parallel workers
         db_name = db_config["NAME"]
-        is_test_db = (
-            db_name == ":memory:"
-            or db_name.startswith(("test_", "file:"))  # test_ prefix or SQLite file URI
-            or "test" in db_name.lower()
-            or "memorydb" in db_name.lower()  # pytest-xdist shared memory db
-        )
-        assert is_test_db, f"Database doesn't appear to be a test database: {db_name}"
-
-    def test_debug_disabled_in_tests(self):
+        assert TEST_DB_NAME_RE.search(
+            db_name
+        ), f"Database doesn't appear to be a test database: {db_name}"
+
+    def test_debug_toolbar_not_loaded_in_tests(self, installed_apps, middleware):
+        """Development-only apps should not leak into the test settings."""
+        assert "debug_toolbar" not in installed_apps
+        assert not any("debug_toolbar" in mw for mw in middleware)
+
+    def test_debug_disabled_in_tests(self, settings_snapshot):
         """DEBUG should be False in test settings."""
         assert (
-            settings.DEBUG is False
+            settings_snapshot.DEBUG is False
         ), "DEBUG should be False in tests to match production behavior"
 
     def test_environment_settings_path(self):
         """Settings should be loaded from config.settings."""
-        settings_module = os.environ.get("DJANGO_SETTINGS_MODULE")
-        assert settings_module is not None
-        assert settings_module.startswith("config.settings")
+        assert SETTINGS_MODULE_IN_CONFIG, f"Unexpected module: {SETTINGS_MODULE}"
 
-    def test_base_dir_accessible(self):
+    def test_base_dir_accessible(self, settings_snapshot):
         """BASE_DIR should be accessible and valid."""
-        assert settings.BASE_DIR.exists()
-        assert settings.BASE_DIR.is_dir()
+        assert settings_snapshot.BASE_DIR.exists()
+        assert settings_snapshot.BASE_DIR.is_dir()
 
-    def test_required_directories_exist(self):
+    @pytest.mark.parametrize("name", sorted(REQUIRED_DIRS))
+    def test_required_directory_exists(self, name, base_dir_subdirs):
         """Required directories should exist."""
-        required_dirs = [
-            settings.BASE_DIR / "config",
-            settings.BASE_DIR / "templates",
-            settings.BASE_DIR / "static",
-        ]
-        for directory in required_dirs:
-            assert directory.exists(), f"Required directory missing: {directory}"
+        assert name in base_dir_subdirs, f"Required directory missing: {name}"
 
 
 class TestEnvironmentVariableHandling:
     """Test environment variable handling."""
 
-    def test_debug_env_var_handling(self):
+    def test_debug_env_var_handling(self, settings_snapshot):
         """DEBUG setting should handle environment variable."""
         # Test that DEBUG can be controlled by environment
         # Note: This test just verifies DEBUG is a boolean
-        assert isinstance(settings.DEBUG, bool)
+        assert isinstance(settings_snapshot.DEBUG, bool)
 
-    def test_allowed_hosts_env_var_handling(self):
+    def test_allowed_hosts_env_var_handling(self, settings_snapshot):
         """ALLOWED_HOSTS should handle environment variable."""
-        assert isinstance(settings.ALLOWED_HOSTS, list)
+        assert isinstance(settings_snapshot.ALLOWED_HOSTS, list)
 
-    def test_secret_key_exists(self):
+    def test_secret_key_exists(self, settings_snapshot):
         """SECRET_KEY should exist and not be empty."""
-        assert settings.SECRET_KEY
-        assert len(settings.SECRET_KEY) > 10
+        assert settings_snapshot.SECRET_KEY
+        assert len(settings_snapshot.SECRET_KEY) > 10
 
-    def test_default_from_email(self):
+    def test_default_from_email(self, settings_snapshot):
         """DEFAULT_FROM_EMAIL should have a value."""
-        assert settings.DEFAULT_FROM_EMAIL is not None
-        assert "@" in settings.DEFAULT_FROM_EMAIL
+        assert settings_snapshot.DEFAULT_FROM_EMAIL is not None
+        assert "@" in settings_snapshot.DEFAULT_FROM_EMAIL
 
 
 class TestSettingsInheritance:
     """Test settings inheritance between base and environment-specific."""
 
-    def test_base_settings_available(self):
+    def test_base_settings_available(self, settings_snapshot):
         """Base settings should be available."""
         # Test a few key base settings
-        assert hasattr(settings, "INSTALLED_APPS")
-        assert hasattr(settings, "MIDDLEWARE")
-        assert hasattr(settings, "TEMPLATES")
+        assert hasattr(settings_snapshot, "INSTALLED_APPS")
+        assert hasattr(settings_snapshot, "MIDDLEWARE")
+        assert hasattr(settings_snapshot, "TEMPLATES")
 
-    def test_environment_override_works(self):
+    def test_environment_override_works(self, settings_snapshot):
         """Environment-specific settings should override base."""
         # This test verifies that environment files can override base
         # The exact test depends on which environment is active
-        assert hasattr(settings, "DATABASES")
-        assert "default" in settings.DATABASES
+        assert hasattr(settings_snapshot, "DATABASES")
+        assert "default" in settings_snapshot.DATABASES
 
     def test_no_circular_imports(self):
         """Settings import should not cause circular imports."""
-        try:
-            from config.settings import base  # noqa: F401
-
-            success = True
-        except ImportError:
-            success = False
-        assert success, "Settings import caused circular import"
+        # Let an ImportError propagate so pytest shows the import chain
+        assert importlib.import_module("config.settings.base") is not None
 
 
 class TestSettingsValidation:
     """Test settings validation."""
 
-    def test_required_apps_present(self):
+    @pytest.mark.parametrize("app", sorted(REQUIRED_APPS))
+    def test_required_app_present(self, app, installed_apps):
         """Required Django apps should be present."""
-        required_apps = [
-            "django.contrib.admin",
-            "django.contrib.auth",
-            "django.contrib.contenttypes",
-        ]
-        for app in required_apps:
-            assert app in settings.INSTALLED_APPS
-
-    def test_database_configured(self):
+        assert app in installed_apps, f"Not in INSTALLED_APPS: {app}"
+
+    def test_database_configured(self, settings_snapshot):
         """Database should be properly configured."""
-        assert "default" in settings.DATABASES
-        db_config = settings.DATABASES["default"]
+        assert "default" in settings_snapshot.DATABASES
+        db_config = settings_snapshot.DATABASES["default"]
         assert "ENGINE" in db_config
         assert "NAME" in db_config
 
-    def test_static_files_configured(self):
+    def test_static_files_configured(self, settings_snapshot):
         """Static files should be configured."""
-        assert hasattr(settings, "STATIC_URL")
-        assert hasattr(settings, "STATIC_ROOT")
-        assert hasattr(settings, "STATICFILES_DIRS")
+        assert hasattr(settings_snapshot, "STATIC_URL")
+        assert hasattr(settings_snapshot, "STATIC_ROOT")
+        assert hasattr(settings_snapshot, "STATICFILES_DIRS")
 
-    def test_templates_configured(self):
+    def test_templates_configured(self, settings_snapshot):
         """Templates should be configured."""
-        assert len(settings.TEMPLATES) > 0
-        assert "BACKEND" in settings.TEMPLATES[0]
-        assert "DIRS" in settings.TEMPLATES[0]
-
-    def test_middleware_stack_complete(self):
-        """Middleware stack should be complete."""
-        # Check for security-critical middleware
-        critical_middleware = [
-            "django.middleware.security.SecurityMiddleware",
-            "django.middleware.csrf.CsrfViewMiddleware",
-            "django.contrib.auth.middleware.AuthenticationMiddleware",
-        ]
-        for middleware in critical_middleware:
-            assert middleware in settings.MIDDLEWARE
-
-    def test_auth_backend_configured(self):
+        assert len(settings_snapshot.TEMPLATES) > 0
+        assert "BACKEND" in settings_snapshot.TEMPLATES[0]
+        assert "DIRS" in settings_snapshot.TEMPLATES[0]
+
+    @pytest.mark.parametrize("name", sorted(CRITICAL_MIDDLEWARE))
+    def test_critical_middleware_present(self, name, middleware):
+        """Security-critical middleware should be in the stack."""
+        assert name in middleware, f"Not in MIDDLEWARE: {name}"
+
+    def test_auth_backend_configured(self, settings_snapshot):
         """Authentication backends should be configured."""
-        assert hasattr(settings, "AUTHENTICATION_BACKENDS")
-        assert len(settings.AUTHENTICATION_BACKENDS) > 0
+        assert hasattr(settings_snapshot, "AUTHENTICATION_BACKENDS")
+        assert len(settings_snapshot.AUTHENTICATION_BACKENDS) > 0
 
-    def test_custom_user_model_configured(self):
+    def test_custom_user_model_configured(self, settings_snapshot):
         """Custom user model should be configured."""
-        assert settings.AUTH_USER_MODEL == "accounts.CustomUser"
+        assert settings_snapshot.AUTH_USER_MODEL == "accounts.CustomUser"
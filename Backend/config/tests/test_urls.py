@@ -9,38 +9,85 @@ This module tests:
 - URL name resolution
 """
 
+import functools
+import importlib
+import re
+
 import pytest
 from django.conf import settings
-from django.urls import resolve, reverse
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import JsonResponse
+from django.test import override_settings
+from django.urls import (
+    Resolver404,
+    clear_url_caches,
+    get_resolver,
+    resolve,
+    reverse,
+)
+
+SENSITIVE_URL_RE = re.compile(r"secret|password|token|key")
+
+# Top-level routes only: the included admin and allauth URLconfs legitimately
+# route password/ and key/ views
+ROOT_URL_ROUTES = tuple(
+    str(pattern.pattern).lower() for pattern in get_resolver().url_patterns
+)
+
+# Each URL name is reversed once per session
+cached_reverse = functools.lru_cache(maxsize=None)(reverse)
+
+
+@receiver(setting_changed)
+def _clear_cached_reverse(*, setting, **kwargs):
+    if setting == "ROOT_URLCONF":
+        cached_reverse.cache_clear()
 
 
 class TestURLPatterns:
     """Test URL configuration."""
 
-    def test_admin_url_exists(self):
-        """Admin URL should be configured."""
-        url = reverse("admin:index")
-        assert url == "/admin/"
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [("admin:index", "/admin/"), ("health", "/health/")],
+    )
+    def test_url_round_trip(self, name, expected):
+        """Named URLs should reverse to their path and resolve back to the name."""
+        url = cached_reverse(name)
+        assert url == expected
+        assert resolve(url).view_name == name
+
+    @pytest.mark.parametrize(
+        "name", ["account_login", "account_logout", "account_signup"]
+    )
+    def test_allauth_url(self, name):
+        """Allauth URLs should be mounted under /accounts/."""
+        assert cached_reverse(name).startswith("/accounts/")
+
 
-    def test_admin_url_resolves(self):
-        """Admin URL should resolve correctly."""
-        resolver = resolve("/admin/")
-        assert resolver is not None
+@pytest.fixture
+def urls_without_admin():
+    """Rebuild config.urls with ADMIN_ENABLED=False; restore it afterwards."""
+    import config.urls
 
-    def test_allauth_login_url(self):
-        """Allauth login URL should be configured."""
-        url = reverse("account_login")
-        assert url.startswith("/accounts/")
+    with override_settings(ADMIN_ENABLED=False):
+        importlib.reload(config.urls)
+        clear_url_caches()
+        yield
+    importlib.reload(config.urls)
+    clear_url_caches()
 
-    def test_allauth_logout_url(self):
-        """Allauth logout URL should be configured."""
-        url = reverse("account_logout")
-        assert url.startswith("/accounts/")
 
-    def test_allauth_signup_url(self):
-        """Allauth signup URL should be configured."""
-        url = reverse("account_signup")
-        assert url.startswith("/accounts/")
+class TestAdminDisabled:
+    """Test the admin URLs when ADMIN_ENABLED is off."""
+
+    @pytest.mark.usefixtures("urls_without_admin")
+    def test_admin_not_routed(self):
+        """/admin/ should 404 when the admin is disabled."""
+        # Resolve directly: rendering the 404 page needs a staticfiles manifest
+        with pytest.raises(Resolver404):
+            resolve("/admin/")
 
 
 class TestDebugToolbarURLs:
@@ -62,19 +109,91 @@ class TestURLSecurity:
 
     def test_admin_requires_trailing_slash(self):
         """Admin URL should require trailing slash."""
-        url = reverse("admin:index")
+        url = cached_reverse("admin:index")
         assert url.endswith("/")
 
     def test_no_sensitive_data_in_urls(self):
         """URLs should not expose sensitive data patterns."""
-        # This is a basic check - extend as needed
-        sensitive_patterns = ["secret", "password", "token", "key"]
-        from django.urls import get_resolver
-
-        urlpatterns = get_resolver().url_patterns
-        for pattern in urlpatterns:
-            pattern_str = str(pattern.pattern).lower()
-            for sensitive in sensitive_patterns:
-                assert (
-                    sensitive not in pattern_str
-                ), f"URL pattern contains sensitive word: {sensitive}"
+        for route in ROOT_URL_ROUTES:
+            match = SENSITIVE_URL_RE.search(route)
+            assert not match, f"URL pattern contains sensitive word: {match[0]}"
+
+
+class StaleConnection:
+    """An open connection to a database that has since gone away."""
+
+    def __init__(self, health_check_enabled):
+        self.health_check_enabled = health_check_enabled
+        self.connection = object()
+        self.pings = 0
+
+    def is_usable(self):
+        self.pings += 1
+        return False
+
+    def close(self):
+        self.connection = None
+
+    def close_if_health_check_failed(self):
+        if self.health_check_enabled and not self.is_usable():
+            self.close()
+
+    def ensure_connection(self):
+        if self.connection is None:
+            raise RuntimeError("database down")
+
+
+@pytest.mark.django_db
+class TestHealthCheck:
+    """Test the cached /health/ database probe."""
+
+    @pytest.fixture(autouse=True)
+    def _expire_cache(self, monkeypatch):
+        from config import urls
+
+        monkeypatch.setitem(urls._health_last_ok, "t", float("-inf"))
+
+    def test_healthy(self, client):
+        """Health check should report a connected database."""
+        response = client.get("/health/")
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy", "database": "connected"}
+
+    def test_probe_cached_within_ttl(self, client, monkeypatch):
+        """Only the first probe inside the TTL should hit the database."""
+        from config import urls
+
+        calls = []
+        probe = urls._probe_database
+        monkeypatch.setattr(urls, "_probe_database", lambda: calls.append(probe()))
+        client.get("/health/")
+        response = client.get("/health/")
+        assert response.status_code == 200
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("health_check_enabled", [True, False])
+    def test_stale_connection_detected(self, client, monkeypatch, health_check_enabled):
+        """A dead persistent connection should be reported, with one ping."""
+        from config import urls
+
+        stale = StaleConnection(health_check_enabled)
+        monkeypatch.setattr(urls, "connection", stale)
+        assert client.get("/health/").status_code == 503
+        assert stale.pings == 1
+
+    def test_failure_not_cached(self, client, monkeypatch):
+        """A failed probe should be retried on the next request."""
+        from config import urls
+
+        real_connection = urls.connection
+        monkeypatch.setattr(urls, "connection", StaleConnection(False))
+        assert client.get("/health/").status_code == 503
+        monkeypatch.setattr(urls, "connection", real_connection)
+        assert client.get("/health/").status_code == 200
+
+    def test_healthy_body_matches_json_response(self):
+        """The precomputed body should match what JsonResponse would send."""
+        from config import urls
+
+        expected = JsonResponse({"status": "healthy", "database": "connected"})
+        assert expected.content == urls._HEALTHY_BODY
@@ -9,33 +9,54 @@ This module tests:
 
 import os
 
+import pytest
+
+
+@pytest.fixture(scope="module")
+def wsgi_app():
+    """The WSGI application, imported once for the module."""
+    from config.wsgi import application
+
+    return application
+
+
+@pytest.fixture(scope="module")
+def wsgi_environ():
+    """A minimal WSGI environ dict for a GET request to /."""
+    return {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/",
+        "SERVER_NAME": "testserver",
+        "SERVER_PORT": "80",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": None,
+        "wsgi.errors": None,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+
 
 class TestWSGIConfiguration:
     """Test WSGI configuration."""
 
-    def test_wsgi_application_importable(self):
+    def test_wsgi_application_importable(self, wsgi_app):
         """WSGI application should be importable."""
-        from config.wsgi import application
+        assert wsgi_app is not None
 
-        assert application is not None
-
-    def test_wsgi_application_callable(self):
+    def test_wsgi_application_callable(self, wsgi_app):
         """WSGI application should be callable."""
-        from config.wsgi import application
-
-        assert callable(application)
+        assert callable(wsgi_app)
 
+    @pytest.mark.usefixtures("wsgi_app")
     def test_django_settings_module_set(self):
         """DJANGO_SETTINGS_MODULE should be set in WSGI."""
-        # Import the wsgi module to trigger the os.environ.setdefault
-        import config.wsgi  # noqa: F401
-
+        # Importing config.wsgi runs its os.environ.setdefault
         assert "DJANGO_SETTINGS_MODULE" in os.environ
 
+    @pytest.mark.usefixtures("wsgi_app")
     def test_wsgi_uses_correct_settings(self):
         """WSGI should use the correct settings module."""
-        from config.wsgi import application  # noqa: F401
-
         settings_module = os.environ.get("DJANGO_SETTINGS_MODULE")
         assert settings_module is not None
         assert settings_module.startswith("config.settings")
@@ -44,24 +65,8 @@ class TestWSGIConfiguration:
 class TestWSGIIntegration:
     """Test WSGI integration with Django."""
 
-    def test_wsgi_can_handle_request(self):
+    def test_wsgi_can_handle_request(self, wsgi_app, wsgi_environ):
         """WSGI application should be able to handle requests."""
-        from config.wsgi import application
-
-        # Create a minimal WSGI environ dict
-        environ = {
-            "REQUEST_METHOD": "GET",
-            "PATH_INFO": "/",
-            "SERVER_NAME": "testserver",
-            "SERVER_PORT": "80",
-            "wsgi.url_scheme": "http",
-            "wsgi.input": None,
-            "wsgi.errors": None,
-            "wsgi.multithread": False,
-            "wsgi.multiprocess": True,
-            "wsgi.run_once": False,
-        }
-
         # Mock start_response
         responses = []
 
@@ -71,9 +76,9 @@ class TestWSGIIntegration:
 
         # This should not raise an exception
         try:
-            result = application(environ, start_response)
+            result = wsgi_app(wsgi_environ, start_response)
             assert result is not None
         except Exception:
             # Some errors are expected in test environment without full setup
             # but the application should at least be callable
-            assert callable(application)
+            assert callable(wsgi_app)